@@ -2,55 +2,118 @@ from __future__ import annotations
 
 import logging
 import os
+import subprocess
 import sys
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from . import launcher as launcher_module
-from .calibration import apply_homography, build_calib_points, load_homography
+from .calibration import (
+    CalibrationData,
+    build_calib_points,
+    load_homography,
+    make_homography_fn,
+)
 from .calibration_ui import CalibrationUI
 from .config import Settings, load_settings
-from .constants import FPS
+from .constants import FPS, IDLE_WAIT_MS
 from .laser_tracker import LaserDetection
 from .laser_tracker import LaserTracker
 from .logging_utils import setup_logging
 from .pointer import PointerRouter
 from .test_mode import TestMode
+from .ui import gray_surface
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Vom Tracker-Thread gepostet, damit der Hauptloop aus event.wait() aufwacht.
+LASER_EVENT = pygame.event.custom_type()
+
+
+def _post_laser_event() -> None:
+    pygame.event.post(pygame.event.Event(LASER_EVENT))
+
+
+def configure_event_filter() -> None:
+    """Nur Events in die Queue lassen, die der Hauptloop auswertet."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [
+            pygame.QUIT,
+            pygame.KEYDOWN,
+            pygame.MOUSEMOTION,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.WINDOWEXPOSED,
+            LASER_EVENT,
+        ]
+    )
+
 
 def init_display(settings: Settings) -> pygame.Surface:
     os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
-    flags = pygame.FULLSCREEN
+    # Ohne Wirkung auf reine Software-Surfaces; Backends mit Doppelpuffer flippen damit tearingfrei.
+    flags = pygame.FULLSCREEN | pygame.DOUBLEBUF
     screen = pygame.display.set_mode((settings.screen_width, settings.screen_height), flags)
     pygame.display.set_caption("Laser Arcade")
     return screen
 
 
-def try_set_resolution(settings: Settings) -> None:
-    """Best-effort Anpassung auf 1024x768@60 via xrandr, falls verfügbar."""
-    import subprocess
+_XRANDR_CACHE: Optional[Tuple[Tuple[str, ...], Optional[str]]] = None
+
 
+def _scan_xrandr() -> Optional[Tuple[Tuple[str, ...], Optional[str]]]:
+    """Lese verbundene Ausgänge und aktuellen Modus einmalig aus `xrandr --current`."""
     try:
         result = subprocess.run(["xrandr", "--current"], capture_output=True, text=True, check=True)
     except FileNotFoundError:
         LOGGER.info("xrandr nicht verfügbar – überspringe Auflösungs-Check")
-        return
+        return None
     except subprocess.CalledProcessError as exc:
         LOGGER.warning("xrandr-Aufruf fehlgeschlagen: %s", exc)
-        return
+        return None
 
     outputs = []
+    current_mode = None
+    in_connected = False
     for line in result.stdout.splitlines():
-        if " connected" in line:
-            outputs.append(line.split()[0])
+        if not line.startswith((" ", "\t")):
+            in_connected = " connected" in line
+            if in_connected:
+                outputs.append(line.split()[0])
+        elif in_connected and current_mode is None and "*" in line:
+            current_mode = line.split()[0]
+    return tuple(outputs), current_mode
+
+
+def try_set_resolution(settings: Settings, force_refresh: bool = False) -> None:
+    """Best-effort Anpassung auf 1024x768@60 via xrandr, falls verfügbar."""
+    global _XRANDR_CACHE
+    if not settings.try_set_resolution:
+        LOGGER.debug("xrandr-Auflösungswechsel per Einstellung deaktiviert")
+        return
+    if not os.environ.get("DISPLAY"):
+        LOGGER.info("Kein DISPLAY gesetzt – überspringe xrandr")
+        return
+
+    if _XRANDR_CACHE is None or force_refresh:
+        scanned = _scan_xrandr()
+        if scanned is None:
+            return
+        _XRANDR_CACHE = scanned
+    outputs, current_mode = _XRANDR_CACHE
     if not outputs:
         LOGGER.info("Keine verbundenen Displays von xrandr gemeldet")
         return
+    mode = f"{settings.screen_width}x{settings.screen_height}"
+    if current_mode == mode:
+        LOGGER.info("Auflösung %s bereits aktiv.", mode)
+        return
 
     for output in outputs:
         cmd = [
@@ -58,64 +121,105 @@ def try_set_resolution(settings: Settings) -> None:
             "--output",
             output,
             "--mode",
-            f"{settings.screen_width}x{settings.screen_height}",
+            mode,
             "--rate",
             "60",
         ]
         res = subprocess.run(cmd, capture_output=True, text=True)
         if res.returncode == 0:
             LOGGER.info("Auflösung über xrandr für %s gesetzt.", output)
+            _XRANDR_CACHE = (outputs, mode)
             return
         LOGGER.warning("Konnte Auflösung für %s nicht setzen: %s", output, res.stderr.strip())
 
 
-def render_debug_overlay(
-    screen: pygame.Surface,
-    detection: Optional[LaserDetection],
-    fps: float,
-) -> None:
-    overlay = pygame.Surface((360, 180), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    font = pygame.font.SysFont("Arial", 20)
-    lines = [
-        f"FPS: {fps:.1f}",
-        f"Area: {detection.area if detection else 0:.1f}",
-        f"Confidence: {detection.confidence if detection else 0:.2f}",
-        f"Point: {detection.point if detection else None}",
-    ]
-    for idx, line in enumerate(lines):
-        txt = font.render(line, True, (255, 255, 255))
-        overlay.blit(txt, (10, 10 + idx * 26))
-
-    if detection and detection.mask_preview is not None:
-        try:
-            surf = pygame.image.frombuffer(
-                detection.mask_preview.tobytes(),
-                detection.mask_preview.shape[1::-1],
-                "RGB",
-            )
-            preview_rect = surf.get_rect(bottomright=(overlay.get_width() - 10, overlay.get_height() - 10))
-            pygame.draw.rect(overlay, (200, 200, 200), preview_rect.inflate(6, 6), 1)
-            overlay.blit(surf, preview_rect)
-        except Exception:
-            LOGGER.debug("Fehler beim Rendern der Masken-Vorschau", exc_info=True)
+class DebugOverlay:
+    """Debug-Overlay mit fester Größe; Surface, Font und Textzeilen werden wiederverwendet."""
+
+    SIZE = (360, 180)
+    TEXT_CACHE_LIMIT = 16
+
+    def __init__(self) -> None:
+        self._surface = pygame.Surface(self.SIZE, pygame.SRCALPHA)
+        self._font = pygame.font.SysFont("Arial", 20)
+        self._text_cache: OrderedDict[str, pygame.Surface] = OrderedDict()
+        self._mask_source: Optional[np.ndarray] = None
+        self._mask_surface: Optional[pygame.Surface] = None
+
+    def _text(self, line: str, cacheable: bool = True) -> pygame.Surface:
+        """Nur wiederkehrende Zeilen cachen (LRU); Messwerte ändern sich fast jeden Frame."""
+        if not cacheable:
+            return self._font.render(line, True, (255, 255, 255))
+        surf = self._text_cache.get(line)
+        if surf is None:
+            if len(self._text_cache) >= self.TEXT_CACHE_LIMIT:
+                self._text_cache.popitem(last=False)
+            surf = self._font.render(line, True, (255, 255, 255))
+            self._text_cache[line] = surf
+        else:
+            self._text_cache.move_to_end(line)
+        return surf
+
+    def render(
+        self,
+        screen: pygame.Surface,
+        detection: Optional[LaserDetection],
+        fps: float,
+        camera_buffer: Optional[int] = None,
+    ) -> pygame.Rect:
+        overlay = self._surface
+        overlay.fill((0, 0, 0, 160))
+        # Ohne Erkennung sind Area/Confidence/Point konstant und damit cachebar, FPS nie.
+        idle = detection is None
+        lines = [
+            (f"FPS: {fps:.1f}", False),
+            (f"Area: {detection.area if detection else 0:.1f}", idle),
+            (f"Confidence: {detection.confidence if detection else 0:.2f}", idle),
+            (f"Point: {detection.point if detection else None}", idle),
+            (f"Buffer: {camera_buffer or '-'}", True),
+        ]
+        for idx, (line, cacheable) in enumerate(lines):
+            overlay.blit(self._text(line, cacheable), (10, 10 + idx * 26))
 
-    screen.blit(overlay, (15, 15))
+        if detection and detection.mask_preview is not None:
+            try:
+                mask_preview = detection.mask_preview
+                if mask_preview is not self._mask_source:
+                    self._mask_surface = gray_surface(mask_preview)
+                    self._mask_source = mask_preview
+                surf = self._mask_surface
+                preview_rect = surf.get_rect(bottomright=(overlay.get_width() - 10, overlay.get_height() - 10))
+                pygame.draw.rect(overlay, (200, 200, 200), preview_rect.inflate(6, 6), 1)
+                overlay.blit(surf, preview_rect)
+            except Exception:
+                LOGGER.debug("Fehler beim Rendern der Masken-Vorschau", exc_info=True)
+
+        return screen.blit(overlay, (15, 15))
 
 
 def main() -> None:
     setup_logging()
     settings = load_settings()
+    # Kleiner Mischpuffer (~12 ms bei 44.1 kHz), passend zum Frame-Takt.
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
     pygame.init()
     pygame.font.init()
+    configure_event_filter()
     clock = pygame.time.Clock()
     try_set_resolution(settings)
     screen = init_display(settings)
     screen_points = build_calib_points(*screen.get_size())
 
     homography_data = load_homography(screen_points)
+    homography_fn = make_homography_fn(homography_data.homography)
     active_app = None
-    calibration_ui = CalibrationUI(screen, on_done=lambda data: homography_data.__dict__.update(data.__dict__))
+
+    def on_calibration_done(data: CalibrationData) -> None:
+        nonlocal homography_fn
+        homography_data.__dict__.update(data.__dict__)
+        homography_fn = make_homography_fn(homography_data.homography)
+
+    calibration_ui = CalibrationUI(screen, on_done=on_calibration_done)
     test_mode = None
     running = True
 
@@ -134,8 +238,12 @@ def main() -> None:
     tracker = None
     camera_ok = True
     camera_error: Optional[str] = None
+    cam_overlay: Optional[pygame.Surface] = None
+    cam_overlay_key: Optional[tuple] = None
+    debug_overlay: Optional[DebugOverlay] = None
+    last_cam_err_ts = 0.0
     try:
-        tracker = LaserTracker(settings)
+        tracker = LaserTracker(settings, on_update=_post_laser_event)
         tracker.start()
     except Exception as exc:
         LOGGER.warning("Kamera-Start fehlgeschlagen, Maus-Modus aktiv: %s", exc)
@@ -143,11 +251,12 @@ def main() -> None:
         camera_error = str(exc)
 
     def reinitialize_display() -> Optional[str]:
-        nonlocal screen, screen_points, homography_data, launcher, calibration_ui, active_app, test_mode
-        try_set_resolution(settings)
+        nonlocal screen, screen_points, homography_data, homography_fn, launcher, calibration_ui, active_app, test_mode
+        try_set_resolution(settings, force_refresh=True)
         screen = init_display(settings)
         screen_points = build_calib_points(*screen.get_size())
         homography_data = load_homography(screen_points)
+        homography_fn = make_homography_fn(homography_data.homography)
         calibration_ui.screen = screen
         calibration_ui.reset()
         launcher = launcher_module.Launcher(
@@ -159,11 +268,13 @@ def main() -> None:
             test_mode.update_context(screen, homography_data.homography)
         if active_app:
             app_cls = type(active_app)
+            close_active_app()
             try:
                 active_app = app_cls(screen)
             except Exception:
                 LOGGER.exception("Aktive App konnte nach Auflösungswechsel nicht neu gestartet werden.")
                 active_app = None
+        retarget_pointer()
         return "Anzeige neu initialisiert."
 
     def restart_tracker() -> tuple[bool, Optional[str]]:
@@ -174,7 +285,7 @@ def main() -> None:
         camera_error = None
         camera_ok = True
         try:
-            tracker = LaserTracker(settings)
+            tracker = LaserTracker(settings, on_update=_post_laser_event)
             tracker.start()
             LOGGER.info("Kamera nach Auswahl neu gestartet.")
         except Exception as exc:
@@ -185,17 +296,27 @@ def main() -> None:
             test_mode.set_camera_status(camera_ok, camera_error)
         return camera_ok, camera_error
 
-    def pointer_handler(evt):
-        nonlocal active_app, launcher, calibration_ui, test_mode
-        target = active_app or test_mode or calibration_ui if calibration_active else launcher
+    # Ziel der Pointer-Events; wird nur bei Zustandswechseln neu gesetzt, nicht pro Event.
+    current_target: Callable[[str, Tuple[int, int]], None] = launcher.handle_pointer
+
+    def retarget_pointer() -> None:
+        nonlocal current_target
         if calibration_active:
-            calibration_ui.handle_pointer(evt.type, evt.position)
+            current_target = calibration_ui.handle_pointer
         elif test_mode:
-            test_mode.handle_pointer(evt.type, evt.position)
+            current_target = test_mode.handle_pointer
         elif active_app:
-            active_app.handle_pointer(evt.type, evt.position)
+            current_target = active_app.handle_pointer
         else:
-            launcher.handle_pointer(evt.type, evt.position)
+            current_target = launcher.handle_pointer
+        # Der Launcher wertet keine Mausbewegungen aus; dort gar nicht erst einreihen.
+        if current_target == launcher.handle_pointer:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+        else:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+
+    def pointer_handler(evt):
+        current_target(evt.type, evt.position)
 
     pointer_router = PointerRouter(
         on_event=pointer_handler,
@@ -210,16 +331,24 @@ def main() -> None:
         pointer_router.update_dwell(settings.dwell_ms, settings.dwell_radius)
 
     calibration_active = False
+
+    def close_active_app() -> None:
+        # Apps räumen explizit auf (z. B. Musik stoppen), statt sich auf __del__ zu verlassen.
+        nonlocal active_app
+        if active_app:
+            active_app.close()
+            active_app = None
+
     def start_app(label: str):
         nonlocal active_app, calibration_active, test_mode
         if label == "__calibrate__":
             calibration_active = True
             test_mode = None
-            active_app = None
+            close_active_app()
             calibration_ui.reset()
         elif label == "__test__":
             calibration_active = False
-            active_app = None
+            close_active_app()
             test_mode = TestMode(
                 screen,
                 settings,
@@ -234,40 +363,69 @@ def main() -> None:
             calibration_active = False
             test_mode = None
             cls = launcher_module.APP_CLASSES[label]
+            close_active_app()
             active_app = cls(screen)
+        retarget_pointer()
 
+    retarget_pointer()
+    presented_view = None
+    presented_overlay: Optional[tuple] = None
+    idle = False
     while running:
+        if idle:
+            # Nichts zu zeichnen: schlafen, bis Eingabe oder eine neue Laser-Erkennung eintrifft.
+            first = pygame.event.wait(IDLE_WAIT_MS)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+        else:
+            events = pygame.event.get()
         dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
+        # Mausbewegungen pro Frame zusammenfassen: nur die letzte Position erreicht den Router.
+        last_motion: Optional[Tuple[int, int]] = None
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = event.pos
+                continue
+            if last_motion is not None and event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                pointer_router.feed_mouse_event("move", last_motion)
+                last_motion = None
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                active_app = None
+                close_active_app()
                 calibration_active = False
                 test_mode = None
-            elif event.type == pygame.MOUSEMOTION:
-                pointer_router.feed_mouse_event("move", event.pos)
+                retarget_pointer()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 pointer_router.feed_mouse_event("down", event.pos)
             elif event.type == pygame.MOUSEBUTTONUP:
                 pointer_router.feed_mouse_event("click", event.pos)
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Fensterinhalt verloren: beim nächsten Frame komplett neu zeichnen.
+                presented_view = None
+        if last_motion is not None:
+            pointer_router.feed_mouse_event("move", last_motion)
 
         if tracker:
             try:
+                # Vorschaubilder nur erzeugen, wenn Debug-Overlay oder Testmodus sie anzeigen.
+                tracker.previews_enabled = settings.debug_overlay or test_mode is not None
                 detection = tracker.read()
-                last_detection = detection
-                if test_mode:
-                    test_mode.set_detection(detection)
-                last_laser_point = detection.point
-                if detection.point:
-                    mapped = (
-                        apply_homography(homography_data.homography, detection.point)
-                        if homography_data.homography is not None
-                        else detection.point
-                    )
-                    pointer_router.feed_point(mapped, source="laser")
+                if detection is not None:
+                    last_detection = detection
+                    if test_mode:
+                        test_mode.set_detection(detection)
+                    last_laser_point = detection.point
+                    if detection.point:
+                        mapped = homography_fn(*detection.point) if homography_fn is not None else detection.point
+                        pointer_router.feed_point(mapped, source="laser")
             except Exception as exc:
-                LOGGER.error("Kamera-Feed Fehler: %s", exc)
+                # Höchstens eine Meldung pro Sekunde, falls die Kamera wiederholt ausfällt.
+                now = time.monotonic()
+                if now - last_cam_err_ts > 1.0:
+                    LOGGER.error("Kamera-Feed Fehler: %s", exc)
+                    last_cam_err_ts = now
                 tracker.stop()
                 tracker = None
                 camera_ok = False
@@ -276,33 +434,62 @@ def main() -> None:
                     test_mode.set_camera_status(camera_ok, camera_error)
 
         if calibration_active:
-            calibration_ui.update(dt)
-            calibration_ui.draw()
+            view = calibration_ui
         elif test_mode:
-            test_mode.update(dt)
-            test_mode.draw()
+            view = test_mode
         elif active_app:
-            active_app.update(dt)
-            active_app.draw()
+            view = active_app
         else:
-            launcher.draw()
+            view = launcher
+        view.update(dt)
+
+        overlay_state = (camera_ok, camera_error, settings.debug_overlay)
+        idle = not (
+            view is not presented_view
+            or overlay_state != presented_overlay
+            or settings.debug_overlay
+            or view.needs_redraw()
+        )
+        if idle:
+            continue
+
+        # draw() liefert geänderte Rects oder None (= ganzer Bildschirm neu).
+        dirty = view.draw()
 
         if not camera_ok:
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
-            font = pygame.font.SysFont("Arial", 28)
-            txt = font.render(
-                f"Kamera nicht verfügbar - Maus-Modus aktiv ({camera_error or 'unbekannt'})",
-                True,
-                (255, 200, 200),
-            )
-            overlay.blit(txt, (40, 40))
-            screen.blit(overlay, (0, 0))
+            overlay_key = (camera_error, screen.get_size())
+            if cam_overlay is None or cam_overlay_key != overlay_key:
+                cam_overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA).convert_alpha()
+                cam_overlay.fill((0, 0, 0, 120))
+                font = pygame.font.SysFont("Arial", 28)
+                txt = font.render(
+                    f"Kamera nicht verfügbar - Maus-Modus aktiv ({camera_error or 'unbekannt'})",
+                    True,
+                    (255, 200, 200),
+                )
+                cam_overlay.blit(txt, (40, 40))
+                cam_overlay_key = overlay_key
+            screen.blit(cam_overlay, (0, 0))
         elif settings.debug_overlay:
-            render_debug_overlay(screen, last_detection, clock.get_fps())
+            if debug_overlay is None:
+                debug_overlay = DebugOverlay()
+            overlay_rect = debug_overlay.render(
+                screen,
+                last_detection,
+                clock.get_fps(),
+                tracker.buffer_size if tracker else None,
+            )
+            if dirty is not None:
+                dirty.append(overlay_rect)
 
-        pygame.display.flip()
+        if dirty is None or view is not presented_view or overlay_state != presented_overlay:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        presented_view = view
+        presented_overlay = overlay_state
 
+    close_active_app()
     if tracker:
         tracker.stop()
     pygame.quit()
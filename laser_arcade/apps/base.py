@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -17,5 +17,14 @@ class BaseApp:
     def update(self, dt: float) -> None:
         return
 
-    def draw(self) -> None:
+    def close(self) -> None:
+        # Wird beim Verlassen der App aufgerufen (Musik, Kanäle, ...).
         return
+
+    def needs_redraw(self) -> bool:
+        # Animierte Apps zeichnen jeden Frame; statische Apps melden hier False, solange sich nichts ändert.
+        return True
+
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        # Rückgabe: geänderte Bereiche für display.update(); None = ganzen Bildschirm flippen.
+        return None
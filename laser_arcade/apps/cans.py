@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-import random
-from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from .base import BaseApp
 from ..ui import make_font
 
 
-@dataclass
-class Can:
-    rect: pygame.Rect
-    alive: bool = True
+BACKGROUND_COLOR = (10, 20, 30)
+CAN_SIZE = (80, 120)
+
+
+def _render_can(color: Tuple[int, int, int]) -> pygame.Surface:
+    sprite = pygame.Surface(CAN_SIZE).convert()
+    sprite.fill(BACKGROUND_COLOR)
+    rect = sprite.get_rect()
+    pygame.draw.rect(sprite, color, rect, border_radius=8)
+    pygame.draw.rect(sprite, (220, 220, 220), rect, 3, border_radius=8)
+    return sprite
 
 
 class CansApp(BaseApp):
@@ -22,36 +28,68 @@ class CansApp(BaseApp):
     def __init__(self, screen: pygame.Surface):
         super().__init__(screen)
         self.font = make_font(28)
+        # Hintergrund und beide Dosen-Zustände einmal vorrendern, pro Frame nur noch blitten.
+        self._bg = pygame.Surface(screen.get_size()).convert()
+        self._bg.fill(BACKGROUND_COLOR)
+        self._alive_sprite = _render_can((180, 180, 180))
+        self._dead_sprite = _render_can((70, 70, 70))
+        self._score_rect = pygame.Rect(20, 20, 0, 0)
+        self._dirty: Optional[List[pygame.Rect]] = None
         self.reset()
 
     def reset(self) -> None:
         self.score = 0
+        self._dirty = None
+        self._render_score()
         width, height = self.screen.get_size()
-        self.cans = []
-        can_width, can_height = 80, 120
-        for i in range(6):
-            x = 100 + i * (can_width + 20)
-            y = height - can_height - 50
-            self.cans.append(Can(pygame.Rect(x, y, can_width, can_height)))
+        can_width, can_height = CAN_SIZE
+        count = 6
+        # Structure-of-Arrays: (x, y, w, h) je Dose plus Lebend-Maske für den Treffer-Test.
+        self._rects = np.empty((count, 4), dtype=np.int32)
+        self._rects[:, 0] = 100 + np.arange(count) * (can_width + 20)
+        self._rects[:, 1] = height - can_height - 50
+        self._rects[:, 2] = can_width
+        self._rects[:, 3] = can_height
+        self._alive = np.ones(count, dtype=bool)
 
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
         if event_type == "click":
-            for can in self.cans:
-                if can.alive and can.rect.collidepoint(pos):
-                    can.alive = False
-                    self.score += 10
-            if all(not c.alive for c in self.cans):
+            x, y = pos
+            rects = self._rects
+            hits = (
+                self._alive
+                & (rects[:, 0] <= x)
+                & (x < rects[:, 0] + rects[:, 2])
+                & (rects[:, 1] <= y)
+                & (y < rects[:, 1] + rects[:, 3])
+            )
+            if hits.any():
+                self._alive &= ~hits
+                self.score += 10 * int(hits.sum())
+                if self._dirty is not None:
+                    self._dirty.extend(pygame.Rect(*rects[i]) for i in np.flatnonzero(hits))
+                self._render_score()
+            if not self._alive.any():
                 self.reset()
 
+    def _render_score(self) -> None:
+        self._score_surf = self.font.render(f"Punkte: {self.score}", True, (255, 255, 255))
+        rect = self._score_surf.get_rect(topleft=(20, 20))
+        if self._dirty is not None:
+            self._dirty.append(rect.union(self._score_rect))
+        self._score_rect = rect
+
     def update(self, dt: float) -> None:
         return
 
-    def draw(self) -> None:
-        self.screen.fill((10, 20, 30))
-        for can in self.cans:
-            color = (180, 180, 180) if can.alive else (70, 70, 70)
-            pygame.draw.rect(self.screen, color, can.rect, border_radius=8)
-            pygame.draw.rect(self.screen, (220, 220, 220), can.rect, 3, border_radius=8)
+    def needs_redraw(self) -> bool:
+        return self._dirty is None or bool(self._dirty)
+
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        self.screen.blit(self._bg, (0, 0))
+        for (x, y, _, _), alive in zip(self._rects.tolist(), self._alive.tolist()):
+            self.screen.blit(self._alive_sprite if alive else self._dead_sprite, (x, y))
 
-        score_surf = self.font.render(f"Punkte: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_surf, (20, 20))
+        self.screen.blit(self._score_surf, (20, 20))
+        dirty, self._dirty = self._dirty, []
+        return dirty
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 import logging
 import random
-from dataclasses import dataclass
+import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pygame
 
 from .base import BaseApp
@@ -18,6 +20,21 @@ FONTS_DIR = MOORHUHN_DIR / "fonts"
 
 LOGGER = logging.getLogger(__name__)
 
+_DIGITS = re.compile(r"\d+")
+
+ROUND_MS = 90_000
+SPAWN_INTERVAL_MS = 1400
+
+# Colorkey für Sprites mit binärer Transparenz
+RLE_COLORKEY = (255, 0, 255)
+
+# (Größe, Geschwindigkeitsbereich, Punkte) je Hühner-Variante
+CHICKEN_VARIANTS = [
+    ((48, 36), (120, 170), 15),
+    ((64, 50), (150, 210), 25),
+    ((80, 64), (190, 260), 40),
+]
+
 
 class _SilentSound:
     def play(self, *_, **__) -> None:
@@ -26,16 +43,36 @@ class _SilentSound:
 
 def _sorted_by_number(paths: List[Path]) -> List[Path]:
     def key(path: Path) -> int:
-        digits = "".join(filter(str.isdigit, path.stem))
-        return int(digits) if digits else 0
+        match = _DIGITS.search(path.stem)
+        return int(match.group()) if match else 0
 
     return sorted(paths, key=key)
 
 
+# Assets werden prozessweit geteilt: eine zweite ChickenApp-Instanz (z. B. nach
+# Auflösungswechsel oder erneutem Start) dekodiert keine PNG/OGG-Dateien erneut.
+@functools.lru_cache(maxsize=None)
 def _load_images(directory: Path) -> List[pygame.Surface]:
     return [pygame.image.load(str(path)).convert_alpha() for path in _sorted_by_number(list(directory.glob("*.png")))]
 
 
+def _as_rle(surface: pygame.Surface) -> pygame.Surface:
+    """Sprites mit rein binärer Transparenz als Colorkey+RLE-Surface, sonst per-Pixel-Alpha."""
+    surface = surface.convert_alpha()
+    alpha = pygame.surfarray.array_alpha(surface)
+    if np.any((alpha > 0) & (alpha < 255)):
+        return surface
+    opaque = pygame.surfarray.array3d(surface)[alpha == 255]
+    if np.any(np.all(opaque == RLE_COLORKEY, axis=-1)):
+        return surface
+    keyed = pygame.Surface(surface.get_size()).convert()
+    keyed.fill(RLE_COLORKEY)
+    keyed.blit(surface, (0, 0))
+    keyed.set_colorkey(RLE_COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+@functools.lru_cache(maxsize=None)
 def _load_sound(path: Path) -> Union[pygame.mixer.Sound, _SilentSound]:
     try:
         return pygame.mixer.Sound(str(path))
@@ -44,55 +81,147 @@ def _load_sound(path: Path) -> Union[pygame.mixer.Sound, _SilentSound]:
         return _SilentSound()
 
 
+def _blit_all(screen: pygame.Surface, draws: List[Tuple[pygame.Surface, object]]) -> None:
+    # fblits (pygame-ce) entpackt die ganze Liste in einem C-Aufruf; blits als Fallback für pygame.
+    if hasattr(screen, "fblits"):
+        screen.fblits(draws)
+    else:
+        screen.blits(draws, doreturn=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_background(size: Tuple[int, int]) -> List[pygame.Surface]:
+    width, height = size
+    sky = pygame.transform.smoothscale(
+        pygame.image.load(str(ASSETS_DIR / "world" / "sky.png")).convert(), (width, height)
+    )
+    hills = pygame.transform.smoothscale(
+        pygame.image.load(str(ASSETS_DIR / "world" / "backgroundHills.gif")).convert(), (width, height)
+    )
+    castle = pygame.transform.smoothscale(
+        pygame.image.load(str(ASSETS_DIR / "world" / "background1.png")).convert(), (width, height)
+    )
+    meadow = pygame.transform.smoothscale(
+        pygame.image.load(str(ASSETS_DIR / "world" / "background2.png")).convert(), (width, height)
+    )
+    return [sky, hills, castle, meadow]
+
+
 def _scale_frames(frames: List[pygame.Surface], size: Tuple[int, int], flip: bool) -> List[pygame.Surface]:
     scaled = [pygame.transform.smoothscale(frame, size) for frame in frames]
     if flip:
         scaled = [pygame.transform.flip(frame, True, False) for frame in scaled]
+    # smoothscale erzeugt halbtransparente Kanten; für Colorkey+RLE kommen skalierte Frames nie in Frage.
     return scaled
 
 
-@dataclass
-class ChickenSprite:
-    frames: List[pygame.Surface]
-    death_frames: List[pygame.Surface]
-    rect: pygame.Rect
-    speed: float
-    points: int
-    alive: bool = True
-    frame_index: int = 0
-    frame_timer: float = 0.0
-    death_index: int = 0
-    death_timer: float = 0.0
-    remove: bool = False
+class ChickenFlock:
+    """Alle Hühner als parallele NumPy-Arrays; update() bewegt und animiert den ganzen Schwarm auf einmal."""
+
+    _FIELDS = {
+        "x": np.float32,
+        "y": np.float32,
+        "w": np.int32,
+        "h": np.int32,
+        "speed": np.float32,
+        "points": np.int32,
+        "alive": np.bool_,
+        "frame_index": np.int32,
+        "frame_timer": np.float32,
+        "frame_count": np.int32,
+        "death_index": np.int32,
+        "death_timer": np.float32,
+        "death_count": np.int32,
+    }
+
+    def __init__(self) -> None:
+        # Pro Huhn Flug- und Todesframes hintereinander, damit draws() nur einen Index braucht.
+        self.sprites: List[List[pygame.Surface]] = []
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def clear(self) -> None:
+        self.sprites = []
+        for name, dtype in self._FIELDS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+
+    def spawn(
+        self,
+        frames: List[pygame.Surface],
+        death_frames: List[pygame.Surface],
+        rect: pygame.Rect,
+        speed: float,
+        points: int,
+    ) -> None:
+        values = {
+            "x": rect.x,
+            "y": rect.y,
+            "w": rect.width,
+            "h": rect.height,
+            "speed": speed,
+            "points": points,
+            "alive": True,
+            "frame_index": 0,
+            "frame_timer": 0.0,
+            "frame_count": len(frames),
+            "death_index": 0,
+            "death_timer": 0.0,
+            "death_count": len(death_frames),
+        }
+        for name, dtype in self._FIELDS.items():
+            setattr(self, name, np.append(getattr(self, name), np.array([values[name]], dtype=dtype)))
+        self.sprites.append(frames + death_frames)
 
     def update(self, dt: float, bounds_width: int) -> None:
-        if self.alive:
-            self.frame_timer += dt
-            if self.frame_timer >= 0.08:
-                self.frame_timer = 0.0
-                self.frame_index = (self.frame_index + 1) % len(self.frames)
-            self.rect.x += int(self.speed * dt)
-            if self.rect.right < -120 or self.rect.left > bounds_width + 120:
-                self.remove = True
-        else:
-            self.death_timer += dt
-            if self.death_timer >= 0.1:
-                self.death_timer = 0.0
-                if self.death_index < len(self.death_frames) - 1:
-                    self.death_index += 1
-                else:
-                    self.remove = True
-            self.rect.y += int(120 * dt)
-
-    def draw(self, screen: pygame.Surface) -> None:
-        frame = self.frames[self.frame_index] if self.alive else self.death_frames[self.death_index]
-        screen.blit(frame, self.rect)
-
-    def shoot(self) -> None:
-        if self.alive:
-            self.alive = False
-            self.death_index = 0
-            self.death_timer = 0.0
+        if not self.sprites:
+            return
+        alive = self.alive
+        dead = ~alive
+
+        self.frame_timer[alive] += dt
+        advance = alive & (self.frame_timer >= 0.08)
+        self.frame_timer[advance] = 0.0
+        self.frame_index[advance] = (self.frame_index[advance] + 1) % self.frame_count[advance]
+        self.x[alive] += self.speed[alive] * dt
+        remove = alive & ((self.x + self.w < -120) | (self.x > bounds_width + 120))
+
+        self.death_timer[dead] += dt
+        step = dead & (self.death_timer >= 0.1)
+        self.death_timer[step] = 0.0
+        finished = step & (self.death_index >= self.death_count - 1)
+        self.death_index[step & ~finished] += 1
+        remove |= finished
+        self.y[dead] += 120 * dt
+
+        if remove.any():
+            keep = ~remove
+            for name in self._FIELDS:
+                setattr(self, name, getattr(self, name)[keep])
+            self.sprites = [sprite for sprite, k in zip(self.sprites, keep.tolist()) if k]
+
+    def draws(self) -> List[Tuple[pygame.Surface, List[int]]]:
+        current = np.where(self.alive, self.frame_index, self.frame_count + self.death_index).tolist()
+        positions = np.stack((self.x, self.y), axis=1).astype(np.int32).tolist()
+        return [(sequence[i], pos) for sequence, i, pos in zip(self.sprites, current, positions)]
+
+    def hit(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Index des ersten lebenden Huhns unter pos oder None."""
+        if not self.sprites:
+            return None
+        px, py = pos
+        x = self.x.astype(np.int32)
+        y = self.y.astype(np.int32)
+        hits = self.alive & (x <= px) & (px < x + self.w) & (y <= py) & (py < y + self.h)
+        idx = np.flatnonzero(hits)
+        return int(idx[0]) if idx.size else None
+
+    def shoot(self, index: int) -> None:
+        if self.alive[index]:
+            self.alive[index] = False
+            self.death_index[index] = 0
+            self.death_timer[index] = 0.0
 
 
 class ChickenApp(BaseApp):
@@ -100,6 +229,8 @@ class ChickenApp(BaseApp):
 
     def __init__(self, screen: pygame.Surface):
         super().__init__(screen)
+        # Die Bildschirmgröße ändert sich nur über einen Neuaufbau der App (Auflösungswechsel).
+        self._w, self._h = screen.get_size()
         self.audio_available = True
         if not pygame.mixer.get_init():
             try:
@@ -109,23 +240,46 @@ class ChickenApp(BaseApp):
                 self.audio_available = False
         self.base_flight_frames = _load_images(ASSETS_DIR / "chicken_flight")
         self.base_death_frames = _load_images(ASSETS_DIR / "chicken_flight_death")
+        # Alle Größen/Richtungen einmal vorskalieren, statt bei jedem Spawn neu zu resamplen.
+        self.scaled_frames: Dict[Tuple[Tuple[int, int], bool], List[pygame.Surface]] = {}
+        self.scaled_death_frames: Dict[Tuple[Tuple[int, int], bool], List[pygame.Surface]] = {}
+        for size, _, _ in CHICKEN_VARIANTS:
+            for flip in (False, True):
+                self.scaled_frames[(size, flip)] = _scale_frames(self.base_flight_frames, size, flip)
+                self.scaled_death_frames[(size, flip)] = _scale_frames(self.base_death_frames, size, flip)
         self.cursor_image, self.cursor_red = self._load_cursors()
-        self.background_layers = self._load_background(screen)
-        self.menu_background = pygame.image.load(str(ASSETS_DIR / "main_menu_background" / "main_menu.png")).convert()
+        self.background_layers = _load_background((self._w, self._h))
+        self.menu_background = pygame.transform.smoothscale(
+            pygame.image.load(str(ASSETS_DIR / "main_menu_background" / "main_menu.png")).convert(),
+            (self._w, self._h),
+        )
         self.menu_logo = pygame.image.load(str(ASSETS_DIR / "main_menu_background" / "moorhuhn.png")).convert_alpha()
         self.font = pygame.font.Font(str(FONTS_DIR / "AA_Magnum.ttf"), 40)
         self.small_font = pygame.font.Font(str(FONTS_DIR / "AA_Magnum.ttf"), 28)
+        # Unveränderliche Texte einmal rastern.
+        self.text_start_prompt = self.font.render("Klicke zum Starten", True, (255, 255, 255))
+        self.text_game_over = self.font.render("Zeit abgelaufen!", True, (255, 215, 0))
+        self.text_restart_prompt = self.small_font.render("Klicke zum Neustart", True, (230, 230, 230))
+        # Wechselnde Texte: Schlüssel -> (angezeigter Wert, gerenderte Surface)
+        self._hud_cache: Dict[str, Tuple[Optional[int], Optional[pygame.Surface]]] = {
+            "score": (None, None),
+            "time": (None, None),
+            "best": (None, None),
+            "final": (None, None),
+        }
+        self._game_over_overlay: Optional[pygame.Surface] = None
         self.sounds = self._load_sounds()
-        self.pointer: Tuple[int, int] = (self.screen.get_width() // 2, self.screen.get_height() // 2)
+        self.pointer: Tuple[int, int] = (self._w // 2, self._h // 2)
         self.state = "menu"
         self.score = 0
         self.best_score = 0
-        self.time_left = 90.0
-        self.spawn_timer = 0.0
-        self.spawn_interval = 1.4
-        self.chickens: List[ChickenSprite] = []
-        self.flash_timer = 0.0
-        self.crosshair_flash = False
+        # Timer als ganze Millisekunden: kein Float-Drift, HUD-Sekunden per Ganzzahldivision.
+        self.time_left_ms = ROUND_MS
+        self.spawn_timer_ms = 0
+        self.spawn_interval_ms = SPAWN_INTERVAL_MS
+        self.chickens = ChickenFlock()
+        # Zeitpunkt (pygame.time.get_ticks) bis zu dem der rote Cursor angezeigt wird.
+        self.flash_until = 0
         self.ambient_channel: pygame.mixer.Channel | None = None
 
     def _load_cursors(self) -> Tuple[pygame.Surface, pygame.Surface]:
@@ -143,7 +297,7 @@ class ChickenApp(BaseApp):
             tint.fill((255, 0, 0, 120))
             cursor_red.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
 
-        return base_cursor, cursor_red
+        return _as_rle(base_cursor), _as_rle(cursor_red)
 
     def _load_sounds(self) -> Dict[str, Union[pygame.mixer.Sound, _SilentSound]]:
         if not self.audio_available:
@@ -168,22 +322,6 @@ class ChickenApp(BaseApp):
             "button": _load_sound(SOUNDS_DIR / "button_click.ogg"),
         }
 
-    def _load_background(self, screen: pygame.Surface) -> List[pygame.Surface]:
-        width, height = screen.get_size()
-        sky = pygame.transform.smoothscale(
-            pygame.image.load(str(ASSETS_DIR / "world" / "sky.png")).convert(), (width, height)
-        )
-        hills = pygame.transform.smoothscale(
-            pygame.image.load(str(ASSETS_DIR / "world" / "backgroundHills.gif")).convert(), (width, height)
-        )
-        castle = pygame.transform.smoothscale(
-            pygame.image.load(str(ASSETS_DIR / "world" / "background1.png")).convert(), (width, height)
-        )
-        meadow = pygame.transform.smoothscale(
-            pygame.image.load(str(ASSETS_DIR / "world" / "background2.png")).convert(), (width, height)
-        )
-        return [sky, hills, castle, meadow]
-
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
         self.pointer = pos
         pygame.mouse.set_pos(pos)
@@ -195,7 +333,7 @@ class ChickenApp(BaseApp):
                 self.sounds["button"].play()
                 self.state = "menu"
                 self.score = 0
-                self.time_left = 90.0
+                self.time_left_ms = ROUND_MS
                 self.chickens.clear()
             else:
                 self._shoot()
@@ -203,11 +341,10 @@ class ChickenApp(BaseApp):
     def _start_game(self) -> None:
         self.state = "playing"
         self.score = 0
-        self.time_left = 90.0
-        self.spawn_timer = 0.0
+        self.time_left_ms = ROUND_MS
+        self.spawn_timer_ms = 0
         self.chickens.clear()
-        self.crosshair_flash = False
-        self.flash_timer = 0.0
+        self.flash_until = 0
         self._play_music(loop=True)
 
     def _play_music(self, loop: bool = False) -> None:
@@ -227,41 +364,30 @@ class ChickenApp(BaseApp):
         if self.state != "playing":
             return
         self.sounds["shot"].play()
-        hit = False
-        for chicken in self.chickens:
-            if chicken.alive and chicken.rect.collidepoint(self.pointer):
-                chicken.shoot()
-                hit = True
-                self.score += chicken.points
-                random.choice(self.sounds["hit"]).play()
-                break
-        self.crosshair_flash = True
-        self.flash_timer = 0.15
-        if hit:
+        index = self.chickens.hit(self.pointer)
+        if index is not None:
+            self.chickens.shoot(index)
+            self.score += int(self.chickens.points[index])
+            random.choice(self.sounds["hit"]).play()
+        self.flash_until = pygame.time.get_ticks() + 150
+        if index is not None:
             self.best_score = max(self.best_score, self.score)
 
     def _spawn_chicken(self) -> None:
-        width, height = self.screen.get_size()
-        size, speed, points = random.choice(
-            [
-                ((48, 36), random.uniform(120, 170), 15),
-                ((64, 50), random.uniform(150, 210), 25),
-                ((80, 64), random.uniform(190, 260), 40),
-            ]
-        )
+        width, height = self._w, self._h
+        size, speed_range, points = random.choice(CHICKEN_VARIANTS)
+        speed = random.uniform(*speed_range)
         direction = random.choice([-1, 1])
         x = -size[0] - 40 if direction > 0 else width + 40
         y = random.randint(int(height * 0.25), int(height * 0.75))
-        frames = _scale_frames(self.base_flight_frames, size, flip=direction < 0)
-        death_frames = _scale_frames(self.base_death_frames, size, flip=direction < 0)
-        chicken = ChickenSprite(
-            frames=frames,
-            death_frames=death_frames,
+        key = (size, direction < 0)
+        self.chickens.spawn(
+            frames=self.scaled_frames[key],
+            death_frames=self.scaled_death_frames[key],
             rect=pygame.Rect(x, y, *size),
             speed=speed * direction,
             points=points,
         )
-        self.chickens.append(chicken)
 
     def update(self, dt: float) -> None:
         if self.state == "menu":
@@ -269,68 +395,71 @@ class ChickenApp(BaseApp):
                 self._play_music(loop=True)
             return
         if self.state == "playing":
-            self.time_left = max(0.0, self.time_left - dt)
-            self.spawn_timer += dt
-            if self.spawn_timer >= self.spawn_interval:
-                self.spawn_timer = 0.0
+            # dt stammt aus clock.tick() in ganzen ms, round() stellt den exakten Wert wieder her.
+            dt_ms = round(dt * 1000)
+            self.time_left_ms = max(0, self.time_left_ms - dt_ms)
+            self.spawn_timer_ms += dt_ms
+            if self.spawn_timer_ms >= self.spawn_interval_ms:
+                self.spawn_timer_ms = 0
                 self._spawn_chicken()
-            for chicken in list(self.chickens):
-                chicken.update(dt, self.screen.get_width())
-                if chicken.remove:
-                    self.chickens.remove(chicken)
-            if self.time_left <= 0:
+            self.chickens.update(dt, self._w)
+            if self.time_left_ms <= 0:
                 self.best_score = max(self.best_score, self.score)
                 self.state = "game_over"
                 self._stop_music()
                 self.sounds["game_over"].play()
-        if self.crosshair_flash:
-            self.flash_timer -= dt
-            if self.flash_timer <= 0:
-                self.crosshair_flash = False
+
+    def _hud_text(
+        self, key: str, value: int, font: pygame.font.Font, template: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Text nur neu rendern, wenn sich der angezeigte Wert geändert hat."""
+        cached_value, surf = self._hud_cache[key]
+        if surf is None or cached_value != value:
+            surf = font.render(template.format(value), True, color)
+            self._hud_cache[key] = (value, surf)
+        return surf
 
     def _draw_hud(self) -> None:
-        hud = self.font.render(f"Punkte: {self.score}", True, (255, 235, 214))
-        timer = self.font.render(f"Zeit: {int(self.time_left)}s", True, (255, 235, 214))
-        best = self.small_font.render(f"Best: {self.best_score}", True, (200, 200, 200))
-        self.screen.blit(hud, (24, 20))
-        self.screen.blit(timer, (24, 70))
-        self.screen.blit(best, (24, 120))
+        hud = self._hud_text("score", self.score, self.font, "Punkte: {}", (255, 235, 214))
+        timer = self._hud_text("time", self.time_left_ms // 1000, self.font, "Zeit: {}s", (255, 235, 214))
+        best = self._hud_text("best", self.best_score, self.small_font, "Best: {}", (200, 200, 200))
+        _blit_all(self.screen, [(hud, (24, 20)), (timer, (24, 70)), (best, (24, 120))])
 
     def _draw_pointer(self) -> None:
-        cursor = self.cursor_red if self.crosshair_flash else self.cursor_image
+        cursor = self.cursor_red if pygame.time.get_ticks() < self.flash_until else self.cursor_image
         rect = cursor.get_rect(center=self.pointer)
         self.screen.blit(cursor, rect)
 
     def draw(self) -> None:
         if self.state == "menu":
-            self.screen.blit(pygame.transform.smoothscale(self.menu_background, self.screen.get_size()), (0, 0))
-            logo_rect = self.menu_logo.get_rect(center=(self.screen.get_width() // 2, 150))
+            self.screen.blit(self.menu_background, (0, 0))
+            logo_rect = self.menu_logo.get_rect(center=(self._w // 2, 150))
             self.screen.blit(self.menu_logo, logo_rect)
-            prompt = self.font.render("Klicke zum Starten", True, (255, 255, 255))
-            prompt_rect = prompt.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 120))
+            prompt = self.text_start_prompt
+            prompt_rect = prompt.get_rect(center=(self._w // 2, self._h - 120))
             self.screen.blit(prompt, prompt_rect)
             self._draw_pointer()
             return
 
         if self.state in {"playing", "game_over"}:
-            for idx, layer in enumerate(self.background_layers):
-                self.screen.blit(layer, (0, 0))
-            for chicken in self.chickens:
-                chicken.draw(self.screen)
+            draws = [(layer, (0, 0)) for layer in self.background_layers]
+            draws.extend(self.chickens.draws())
+            _blit_all(self.screen, draws)
             self._draw_hud()
 
             if self.state == "game_over":
-                overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 150))
-                self.screen.blit(overlay, (0, 0))
-                game_over = self.font.render("Zeit abgelaufen!", True, (255, 215, 0))
-                final_score = self.font.render(f"Endstand: {self.score}", True, (255, 255, 255))
-                restart = self.small_font.render("Klicke zum Neustart", True, (230, 230, 230))
-                self.screen.blit(game_over, game_over.get_rect(center=(self.screen.get_width() // 2, 200)))
-                self.screen.blit(final_score, final_score.get_rect(center=(self.screen.get_width() // 2, 260)))
-                self.screen.blit(restart, restart.get_rect(center=(self.screen.get_width() // 2, 320)))
+                if self._game_over_overlay is None:
+                    self._game_over_overlay = pygame.Surface((self._w, self._h), pygame.SRCALPHA)
+                    self._game_over_overlay.fill((0, 0, 0, 150))
+                self.screen.blit(self._game_over_overlay, (0, 0))
+                game_over = self.text_game_over
+                restart = self.text_restart_prompt
+                final_score = self._hud_text("final", self.score, self.font, "Endstand: {}", (255, 255, 255))
+                self.screen.blit(game_over, game_over.get_rect(center=(self._w // 2, 200)))
+                self.screen.blit(final_score, final_score.get_rect(center=(self._w // 2, 260)))
+                self.screen.blit(restart, restart.get_rect(center=(self._w // 2, 320)))
 
             self._draw_pointer()
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         self._stop_music()
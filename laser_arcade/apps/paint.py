@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import itertools
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -18,8 +18,12 @@ class PaintApp(BaseApp):
         self.colors = [(255, 0, 0), (0, 255, 0), (0, 120, 255), (255, 255, 0), (255, 255, 255)]
         self.color_cycle = itertools.cycle(self.colors)
         self.current_color = next(self.color_cycle)
-        self.lines: List[Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]] = []
+        # Striche werden direkt auf die Leinwand gemalt, statt jeden Frame neu gezeichnet.
+        self.canvas = pygame.Surface(screen.get_size()).convert()
+        self.canvas.fill((0, 0, 0))
+        self.text = self.font.render("Klick zum Farbwechsel", True, (255, 255, 255))
         self.last_pos = None
+        self._dirty: Optional[List[pygame.Rect]] = None
 
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
         if event_type == "click":
@@ -27,15 +31,19 @@ class PaintApp(BaseApp):
             self.last_pos = None
         elif event_type == "move":
             if self.last_pos:
-                self.lines.append((self.last_pos, pos, self.current_color))
+                rect = pygame.draw.line(self.canvas, self.current_color, self.last_pos, pos, width=4)
+                if self._dirty is not None:
+                    self._dirty.append(rect)
             self.last_pos = pos
 
     def update(self, dt: float) -> None:
         return
 
-    def draw(self) -> None:
-        self.screen.fill((0, 0, 0))
-        for start, end, color in self.lines[-2000:]:
-            pygame.draw.line(self.screen, color, start, end, width=4)
-        text = self.font.render("Klick zum Farbwechsel", True, (255, 255, 255))
-        self.screen.blit(text, (20, 20))
+    def needs_redraw(self) -> bool:
+        return self._dirty is None or bool(self._dirty)
+
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        self.screen.blit(self.canvas, (0, 0))
+        self.screen.blit(self.text, (20, 20))
+        dirty, self._dirty = self._dirty, []
+        return dirty
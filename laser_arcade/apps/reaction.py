@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame
 
@@ -19,9 +19,10 @@ class ReactionApp(BaseApp):
 
     def reset(self) -> None:
         self.target_rect = self._new_target()
-        self.best_time = None
-        self.wait_time = random.uniform(1.0, 2.5)
-        self.timer = 0
+        # Alle Zeiten in ganzen Millisekunden.
+        self.best_ms: Optional[int] = None
+        self.wait_ms = random.randint(1000, 2500)
+        self.timer_ms = 0
         self.active = False
 
     def _new_target(self) -> pygame.Rect:
@@ -36,29 +37,30 @@ class ReactionApp(BaseApp):
 
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
         if event_type == "click" and self.active and self.target_rect.collidepoint(pos):
-            if self.timer > 0:
-                self.best_time = min(self.best_time, self.timer) if self.best_time else self.timer
-            self.timer = 0
-            self.wait_time = random.uniform(1.0, 2.5)
+            if self.timer_ms > 0:
+                self.best_ms = min(self.best_ms, self.timer_ms) if self.best_ms else self.timer_ms
+            self.timer_ms = 0
+            self.wait_ms = random.randint(1000, 2500)
             self.active = False
             self.target_rect = self._new_target()
 
     def update(self, dt: float) -> None:
-        self.wait_time -= dt
-        if self.wait_time <= 0:
+        dt_ms = round(dt * 1000)
+        self.wait_ms -= dt_ms
+        if self.wait_ms <= 0:
             self.active = True
-            self.timer += dt
-        if self.timer > 10:
-            self.timer = 0
+            self.timer_ms += dt_ms
+        if self.timer_ms > 10_000:
+            self.timer_ms = 0
             self.active = False
-            self.wait_time = random.uniform(1.0, 2.5)
+            self.wait_ms = random.randint(1000, 2500)
 
     def draw(self) -> None:
         self.screen.fill((0, 30, 20))
         color = (0, 200, 0) if self.active else (60, 60, 60)
         pygame.draw.rect(self.screen, color, self.target_rect, border_radius=8)
-        info = f"Reaktionszeit: {self.timer:.2f}s"
-        if self.best_time:
-            info += f" | Bestzeit: {self.best_time:.2f}s"
+        info = f"Reaktionszeit: {self.timer_ms / 1000:.2f}s"
+        if self.best_ms:
+            info += f" | Bestzeit: {self.best_ms / 1000:.2f}s"
         text = self.font.render(info, True, (255, 255, 255))
         self.screen.blit(text, (20, 20))
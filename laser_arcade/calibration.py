@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import partial
+from typing import Callable, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -69,7 +70,8 @@ def load_homography(screen_points: Optional[List[Tuple[int, int]]] = None) -> Ca
     stored = load_calibration()
     if not stored or stored.get("homography") is None:
         return CalibrationData(homography=None, camera_points=[], screen_points=screen_points)
-    H = np.array(stored["homography"], dtype=np.float32)
+    # reshape akzeptiert die flache Form ebenso wie ältere Dateien mit verschachtelter 3x3-Liste.
+    H = np.array(stored["homography"], dtype=np.float32).reshape(3, 3)
     stored_screen_points = stored.get("screen_points") or screen_points
     camera_points = stored.get("camera_points", [])
     if len(camera_points) != len(stored_screen_points):
@@ -85,7 +87,28 @@ def load_homography(screen_points: Optional[List[Tuple[int, int]]] = None) -> Ca
     )
 
 
-def apply_homography(H: np.ndarray, point: Tuple[int, int]) -> Tuple[int, int]:
-    pts = np.array([[point]], dtype=np.float32)
-    mapped = cv2.perspectiveTransform(pts, H)[0][0]
-    return int(mapped[0]), int(mapped[1])
+def homography_coefficients(H: Optional[np.ndarray]) -> Optional[Tuple[float, ...]]:
+    """Zerlege die Homographie einmalig in neun Python-Floats für `map_point`."""
+
+    if H is None:
+        return None
+    return tuple(np.asarray(H, dtype=np.float64).flatten().tolist())
+
+
+def map_point(coeffs: Tuple[float, ...], x: float, y: float) -> Tuple[int, int]:
+    """Bilde einen einzelnen Punkt ohne NumPy/OpenCV-Dispatch ab (Hot-Path pro Frame)."""
+
+    h00, h01, h02, h10, h11, h12, h20, h21, h22 = coeffs
+    w = h20 * x + h21 * y + h22
+    if w == 0:
+        return int(x), int(y)
+    return int((h00 * x + h01 * y + h02) / w), int((h10 * x + h11 * y + h12) / w)
+
+
+def make_homography_fn(H: Optional[np.ndarray]) -> Optional[Callable[[float, float], Tuple[int, int]]]:
+    """Liefert `map_point` mit einmalig zerlegten Koeffizienten; für einen Punkt schneller als OpenCV."""
+
+    coeffs = homography_coefficients(H)
+    if coeffs is None:
+        return None
+    return partial(map_point, coeffs)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -20,12 +20,18 @@ class CalibrationUI:
         self.camera_points: List[Tuple[int, int]] = []
         self.message = "Ziele auf den Marker und halte kurz still"
         self.screen_points: List[Tuple[int, int]] = build_calib_points(*self.screen.get_size())
+        # Die Ansicht ist zwischen zwei Klicks statisch: einmal pro Zustand rendern, danach nur blitten.
+        self._cached: Optional[pygame.Surface] = None
+        self._dirty = True
+        # Bereiche (Marker, Texte) des zuletzt gerenderten Zustands für pygame.display.update().
+        self._drawn_rects: List[pygame.Rect] = []
 
     def target_point(self) -> Tuple[int, int]:
         return self.screen_points[self.index]
 
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
         if event_type == "click":
+            self._dirty = True
             self.camera_points.append(pos)
             self.index += 1
             if self.index >= len(self.screen_points):
@@ -42,6 +48,7 @@ class CalibrationUI:
                 self.message = "Punkt gesetzt – weiter zum nächsten Marker."
 
     def reset(self, success_message: str | None = None) -> None:
+        self._dirty = True
         self.index = 0
         self.camera_points = []
         self.screen_points = build_calib_points(*self.screen.get_size())
@@ -56,13 +63,35 @@ class CalibrationUI:
         # Platzhalter für zukünftige Animationen oder Audiofeedback
         return
 
-    def draw(self) -> None:
-        self.screen.fill((0, 0, 0))
+    def needs_redraw(self) -> bool:
+        return self._dirty
+
+    def _render(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        surface.fill((0, 0, 0))
         target = self.target_point()
-        pygame.draw.circle(self.screen, (255, 255, 255), target, 18, 3)
-        pygame.draw.circle(self.screen, (0, 200, 0), target, 6)
+        rects = [pygame.draw.circle(surface, (255, 255, 255), target, 18, 3)]
+        pygame.draw.circle(surface, (0, 200, 0), target, 6)
         info = f"Punkt {self.index + 1} / {len(self.screen_points)}"
         text = self.font.render(info, True, (255, 255, 255))
         msg = self.font.render(self.message, True, (200, 200, 200))
-        self.screen.blit(text, (20, 20))
-        self.screen.blit(msg, (20, 60))
+        rects.append(surface.blit(text, (20, 20)))
+        rects.append(surface.blit(msg, (20, 60)))
+        return rects
+
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        size = self.screen.get_size()
+        if self._cached is None or self._cached.get_size() != size:
+            self._cached = pygame.Surface(size).convert()
+            self._drawn_rects = self._render(self._cached)
+            self._dirty = False
+            self.screen.blit(self._cached, (0, 0))
+            return None
+        dirty: List[pygame.Rect] = []
+        if self._dirty:
+            # Alter und neuer Marker/Text reichen; der Rest des Bildschirms bleibt schwarz.
+            rects = self._render(self._cached)
+            dirty = self._drawn_rects + rects
+            self._drawn_rects = rects
+            self._dirty = False
+        self.screen.blit(self._cached, (0, 0))
+        return dirty
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+import numpy as np
 
 from .constants import APP_DIR, CALIBRATION_FILE, CONFIG_FILE, LASER_COLOR_PROFILE
 
 
 LOGGER = logging.getLogger(__name__)
 
+_HSV_BOUND_FIELDS = ("lower1", "upper1", "lower2", "upper2")
+
 
 @dataclass
 class CameraConfig:
@@ -29,6 +33,20 @@ class LaserProfile:
     min_area: int = LASER_COLOR_PROFILE["min_area"]
     max_area: int = LASER_COLOR_PROFILE["max_area"]
     morph_kernel: int = LASER_COLOR_PROFILE["morph_kernel"]
+    use_hsv: bool = LASER_COLOR_PROFILE["use_hsv"]
+    red_threshold: int = LASER_COLOR_PROFILE["red_threshold"]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _HSV_BOUND_FIELDS:
+            # uint8-Kopie für cv2.inRange mitführen; greift beim Konstruieren und bei jeder Änderung.
+            # Vorher clippen: NumPy 2 wirft bei Werten außerhalb 0..255 (z.B. handeditierte settings.json).
+            self.__dict__[f"_{name}_np"] = np.clip(np.asarray(value), 0, 255).astype(np.uint8)
+
+    @property
+    def hsv_bounds(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(lower1, upper1, lower2, upper2) als uint8-Arrays, direkt für cv2.inRange."""
+        return self._lower1_np, self._upper1_np, self._lower2_np, self._upper2_np
 
 
 @dataclass
@@ -41,17 +59,21 @@ class Settings:
     dwell_radius: int = 10
     ema_alpha: float = 0.35
     debug_overlay: bool = False
+    camera_on_demand: bool = True
+    try_set_resolution: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "screen_width": self.screen_width,
             "screen_height": self.screen_height,
             "camera": vars(self.camera),
-            "laser": vars(self.laser),
+            "laser": asdict(self.laser),
             "dwell_ms": self.dwell_ms,
             "dwell_radius": self.dwell_radius,
             "ema_alpha": self.ema_alpha,
             "debug_overlay": self.debug_overlay,
+            "camera_on_demand": self.camera_on_demand,
+            "try_set_resolution": self.try_set_resolution,
         }
 
     @classmethod
@@ -67,6 +89,8 @@ class Settings:
             dwell_radius=data.get("dwell_radius", 10),
             ema_alpha=data.get("ema_alpha", 0.35),
             debug_overlay=data.get("debug_overlay", False),
+            camera_on_demand=data.get("camera_on_demand", True),
+            try_set_resolution=data.get("try_set_resolution", True),
         )
 
 
@@ -74,8 +98,8 @@ def load_settings() -> Settings:
     APP_DIR.mkdir(parents=True, exist_ok=True)
     if CONFIG_FILE.exists():
         try:
-            with CONFIG_FILE.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Ein read() in Bytes; json.loads erkennt UTF-8 selbst, ohne Textdekodierung über einen Stream.
+            data = json.loads(CONFIG_FILE.read_bytes())
             return Settings.from_dict(data)
         except (json.JSONDecodeError, OSError) as exc:
             LOGGER.warning("Einstellungen defekt, lade Defaults: %s", exc)
@@ -87,8 +111,7 @@ def load_settings() -> Settings:
 
 def save_settings(settings: Settings) -> None:
     APP_DIR.mkdir(parents=True, exist_ok=True)
-    with CONFIG_FILE.open("w", encoding="utf-8") as f:
-        json.dump(settings.to_dict(), f, indent=2)
+    CONFIG_FILE.write_text(json.dumps(settings.to_dict(), indent=2), encoding="utf-8")
 
 
 def _backup_corrupt_file(path: Path) -> None:
@@ -110,8 +133,7 @@ def load_calibration() -> Dict[str, Any] | None:
     if not CALIBRATION_FILE.exists():
         return None
     try:
-        with CALIBRATION_FILE.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(CALIBRATION_FILE.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         LOGGER.warning("Kalibrierungsdatei defekt, verwende Defaults: %s", exc)
         _backup_corrupt_file(CALIBRATION_FILE)
@@ -121,9 +143,10 @@ def load_calibration() -> Dict[str, Any] | None:
 def save_calibration(matrix, points_camera, points_screen) -> None:
     APP_DIR.mkdir(parents=True, exist_ok=True)
     data = {
-        "homography": matrix.tolist() if matrix is not None else None,
+        # Flach (9 Werte, zeilenweise) statt verschachtelter Liste; load_homography formt wieder zu 3x3.
+        "homography": matrix.ravel().tolist() if matrix is not None else None,
         "camera_points": points_camera,
         "screen_points": points_screen,
     }
-    with CALIBRATION_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # Kompakt statt indent=2: die Datei wird nur maschinell gelesen.
+    CALIBRATION_FILE.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
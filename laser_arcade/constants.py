@@ -6,6 +6,8 @@ from pathlib import Path
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+# Längste Wartezeit der Hauptschleife ohne Neuzeichnen (Eingaben und Tracker wecken sie früher)
+IDLE_WAIT_MS = 250
 DEFAULT_FONT_SIZE = 32
 LARGE_FONT_SIZE = 44
 TITLE_FONT_SIZE = 56
@@ -15,6 +17,7 @@ APP_DIR = HOME_DIR / ".laser_arcade"
 CONFIG_FILE = APP_DIR / "settings.json"
 CALIBRATION_FILE = APP_DIR / "calibration.json"
 LOG_DIR = APP_DIR / "logs"
+CAMERA_PROBE_CACHE_FILE = APP_DIR / "camera_probe.json"
 
 LASER_COLOR_PROFILE = {
     "lower1": (0, 120, 120),
@@ -24,6 +27,8 @@ LASER_COLOR_PROFILE = {
     "min_area": 12,
     "max_area": 4000,
     "morph_kernel": 3,
+    "use_hsv": True,
+    "red_threshold": 60,
 }
 
 EMA_ALPHA = 0.35
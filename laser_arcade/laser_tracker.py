@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -14,6 +15,11 @@ from .constants import EMA_ALPHA
 LOGGER = logging.getLogger(__name__)
 
 
+def configure_low_latency(cap: cv2.VideoCapture) -> None:
+    """V4L2 hält sonst ~4 Frames vor; mit einem Slot liefert read() immer das frischeste Bild."""
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+
 @dataclass
 class LaserDetection:
     point: Optional[Tuple[int, int]]
@@ -21,18 +27,48 @@ class LaserDetection:
     confidence: float
     frame_ts: float
     mask_preview: Optional[np.ndarray]
-    frame_preview: Optional[np.ndarray]
+    frame_preview: Optional[np.ndarray]  # BGR, zusammenhängend
 
 
 class LaserTracker:
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, on_update: Optional[Callable[[], None]] = None):
         self.settings = settings
+        self.on_update = on_update
         self.cap: Optional[cv2.VideoCapture] = None
-        self.last_point: Optional[np.ndarray] = None
+        self.last_point: Optional[Tuple[float, float]] = None
+        self.buffer_size: Optional[int] = None
+        self.previews_enabled = False
+        self._lock = threading.Lock()
+        self._latest: Optional[LaserDetection] = None
+        self._error: Optional[Exception] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._frame: Optional[np.ndarray] = None
+        self._hsv: Optional[np.ndarray] = None
+        self._mask1: Optional[np.ndarray] = None
+        self._mask2: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+        self._mask_small: Optional[np.ndarray] = None
+        self._frame_small: Optional[np.ndarray] = None
+        self.reconfigure()
 
     def reset_state(self) -> None:
         """Reset stateful detection helpers after parameter changes."""
-        self.last_point = None
+        with self._lock:
+            self.last_point = None
+        self.reconfigure()
+
+    def reconfigure(self) -> None:
+        """Zusammengelegtes Rotband und Morphologie-Kernel einmal pro Profiländerung statt pro Frame aufbauen.
+
+        Beides wird als ein Tupel unter dem Lock getauscht, damit der Worker nie Band und Kernel
+        aus verschiedenen Profilständen kombiniert.
+        """
+        laser_cfg = self.settings.laser
+        merged_bounds = self._merge_red_bands(laser_cfg)
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (laser_cfg.morph_kernel, laser_cfg.morph_kernel))
+        with self._lock:
+            self._detect_params: Tuple[Optional[Tuple[np.ndarray, np.ndarray]], np.ndarray] = (merged_bounds, kernel)
 
     def start(self) -> None:
         cam = self.settings.camera
@@ -42,79 +78,205 @@ class LaserTracker:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, cam.width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cam.height)
         self.cap.set(cv2.CAP_PROP_FPS, cam.fps)
-        LOGGER.info("Kamera gestartet (%s x %s @ %sfps)", cam.width, cam.height, cam.fps)
+        if self.settings.camera_on_demand:
+            configure_low_latency(self.cap)
+        self.buffer_size = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)) or None
+        LOGGER.info(
+            "Kamera gestartet (%s x %s @ %sfps, Puffer=%s)",
+            cam.width,
+            cam.height,
+            cam.fps,
+            self.buffer_size or "?",
+        )
+        self._latest = None
+        self._error = None
+        self._frame = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._capture_loop, name="LaserTracker", daemon=True)
+        self._thread.start()
 
     def stop(self) -> None:
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+            if thread.is_alive():
+                LOGGER.warning("Kamera-Thread hängt in read(); er gibt die Kamera beim Beenden selbst frei")
         if self.cap:
-            self.cap.release()
+            # Läuft ein Worker, gehört ihm die Kamera: release() parallel zu read() kann abstürzen oder blockieren.
+            if thread is None:
+                self.cap.release()
             self.cap = None
+            self.buffer_size = None
             LOGGER.info("Kamera gestoppt")
 
-    def read(self) -> LaserDetection:
+    def read(self) -> Optional[LaserDetection]:
+        """Liefert die neueste Erkennung seit dem letzten Aufruf oder None (nicht blockierend)."""
         if self.cap is None:
             raise RuntimeError("Kamera nicht initialisiert")
-        ret, frame = self.cap.read()
-        if not ret:
-            raise RuntimeError("Frame konnte nicht gelesen werden")
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        laser_cfg = self.settings.laser
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            detection, self._latest = self._latest, None
+        return detection
+
+    def _capture_loop(self) -> None:
+        # Erfassung + Erkennung laufen hier, damit der Render-Loop nie auf die Kamera wartet.
+        cap = self.cap
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    detection = self._capture_and_detect(cap)
+                except Exception as exc:
+                    with self._lock:
+                        self._error = exc
+                    self._notify()
+                    return
+                with self._lock:
+                    self._latest = detection
+                self._notify()
+        finally:
+            # Erst hier freigeben, wenn sicher kein read() mehr läuft (auch nach Join-Timeout in stop()).
+            if cap is not None:
+                cap.release()
+
+    def _notify(self) -> None:
+        if self.on_update is None:
+            return
+        try:
+            self.on_update()
+        except Exception:
+            LOGGER.debug("Tracker-Benachrichtigung fehlgeschlagen", exc_info=True)
+
+    @staticmethod
+    def _merge_red_bands(laser_cfg) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Beide Rotbänder als ein zusammenhängendes Band, falls sie sich am Hue-Wrap treffen.
 
-        lower1 = np.array(laser_cfg.lower1)
-        upper1 = np.array(laser_cfg.upper1)
-        lower2 = np.array(laser_cfg.lower2)
-        upper2 = np.array(laser_cfg.upper2)
+        Mit vertauschten R/B-Kanälen (COLOR_RGB2HSV auf ein BGR-Bild) wird der Farbton zu
+        (120 - H) mod 180 gespiegelt; Rot landet dann um H=120 statt an beiden Enden.
+        Durch die Hue-Rundung verschieben sich die Bandkanten dabei um eine Stufe (z.B. H=8 -> 111,
+        H=170 -> 131): Pixel genau auf der Kante können von der Zwei-Band-Maske abweichen. Ein um eine
+        Stufe verbreitertes Band deckt zwar alle alten Pixel ab, nimmt aber ~10 % Randpixel zusätzlich auf.
+        """
+        # Die bereits auf 0..255 geclippten Grenzen verwenden, sonst wirft np.array(..., uint8) bei Ausreißern.
+        lower1, upper1, lower2, upper2 = (bound.tolist() for bound in laser_cfg.hsv_bounds)
+        if lower1[0] != 0 or upper2[0] < 179 or upper1[0] > 120 or not 121 <= lower2[0] <= 179:
+            return None
+        if tuple(lower1[1:]) != tuple(lower2[1:]) or tuple(upper1[1:]) != tuple(upper2[1:]):
+            return None
+        lower = np.array([120 - upper1[0], lower1[1], lower1[2]], dtype=np.uint8)
+        upper = np.array([300 - lower2[0], upper1[1], upper1[2]], dtype=np.uint8)
+        return lower, upper
 
-        mask1 = cv2.inRange(hsv, lower1, upper1)
-        mask2 = cv2.inRange(hsv, lower2, upper2)
-        mask = cv2.bitwise_or(mask1, mask2)
+    def _ensure_buffers(self, shape: Tuple[int, ...]) -> None:
+        """Scratch-Puffer einmal pro Kameraauflösung anlegen und danach wiederverwenden."""
+        if self._hsv is not None and self._hsv.shape == shape:
+            return
+        height, width = shape[:2]
+        self._hsv = np.empty((height, width, 3), dtype=np.uint8)
+        self._mask1 = np.empty((height, width), dtype=np.uint8)
+        self._mask2 = np.empty((height, width), dtype=np.uint8)
+        self._mask = np.empty((height, width), dtype=np.uint8)
+        self._mask_small = np.empty((120, 160), dtype=np.uint8)
+        self._frame_small = np.empty((300, 400, 3), dtype=np.uint8)
 
-        kernel = cv2.getStructuringElement(
-            cv2.MORPH_ELLIPSE, (laser_cfg.morph_kernel, laser_cfg.morph_kernel)
+    def _hsv_mask(self, frame: np.ndarray, merged: Optional[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+        if merged is not None:
+            # Gespiegelter Farbton kostet nichts extra und spart das zweite inRange samt bitwise_or.
+            hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV, dst=self._hsv)
+            return cv2.inRange(hsv, merged[0], merged[1], dst=self._mask)
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=self._hsv)
+        lower1, upper1, lower2, upper2 = self.settings.laser.hsv_bounds
+        mask1 = cv2.inRange(hsv, lower1, upper1, dst=self._mask1)
+        mask2 = cv2.inRange(hsv, lower2, upper2, dst=self._mask2)
+        return cv2.bitwise_or(mask1, mask2, dst=self._mask)
+
+    def _red_mask(self, frame: np.ndarray) -> np.ndarray:
+        """Einkanaliger Schnellpfad: Rot-Dominanz R - max(B, G) statt HSV-Konvertierung."""
+        cv2.extractChannel(frame, 0, dst=self._mask1)
+        cv2.extractChannel(frame, 1, dst=self._mask2)
+        cv2.max(self._mask1, self._mask2, dst=self._mask1)
+        cv2.extractChannel(frame, 2, dst=self._mask2)
+        cv2.subtract(self._mask2, self._mask1, dst=self._mask2)
+        _, mask = cv2.threshold(
+            self._mask2, self.settings.laser.red_threshold, 255, cv2.THRESH_BINARY, dst=self._mask
         )
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        return mask
+
+    def _capture_and_detect(self, cap: Optional[cv2.VideoCapture] = None) -> LaserDetection:
+        cap = cap or self.cap
+        if cap is None:
+            raise RuntimeError("Kamera nicht initialisiert")
+        # In den Frame-Puffer des Vorgängers lesen; OpenCV legt nur bei geänderter Größe neu an.
+        ret, frame = cap.read(self._frame)
+        if not ret:
+            raise RuntimeError("Frame konnte nicht gelesen werden")
+        self._frame = frame
+        self._ensure_buffers(frame.shape)
+        with self._lock:
+            merged, kernel = self._detect_params
+        laser_cfg = self.settings.laser
+        if laser_cfg.use_hsv:
+            mask = self._hsv_mask(frame, merged)
+        else:
+            mask = self._red_mask(frame)
+
+        # Ping-Pong zwischen den Scratch-Puffern statt neuer Arrays pro Schritt.
+        opened = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel, dst=self._mask1)
+        mask = cv2.morphologyEx(opened, cv2.MORPH_CLOSE, kernel, dst=self._mask)
 
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         best = None
         best_area = 0
+        best_contour = None
         for c in contours:
             area = cv2.contourArea(c)
             if area < laser_cfg.min_area or area > laser_cfg.max_area:
                 continue
             if area > best_area:
                 best_area = area
-                M = cv2.moments(c)
-                if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    best = (cx, cy)
+                best_contour = c
+        if best_contour is not None:
+            # Momente nur einmal für den Gewinner berechnen statt für jeden Zwischenbesten.
+            M = cv2.moments(best_contour)
+            if M["m00"] != 0:
+                best = (int(M["m10"] / M["m00"]), int(M["m01"] / M["m00"]))
 
-        smoothed = None
+        point = None
         if best is not None:
-            point_arr = np.array(best, dtype=np.float32)
-            if self.last_point is None:
-                smoothed = point_arr
-            else:
-                alpha = self.settings.ema_alpha or EMA_ALPHA
-                smoothed = alpha * point_arr + (1 - alpha) * self.last_point
-            self.last_point = smoothed
+            # EMA auf zwei Skalaren: billiger als NumPy-Dispatch für Länge-2-Arrays.
+            cx, cy = best
+            # Lesen + Schreiben unter dem Lock, sonst überschreibt der Worker ein paralleles reset_state().
+            with self._lock:
+                if self.last_point is None:
+                    sx, sy = float(cx), float(cy)
+                else:
+                    alpha = self.settings.ema_alpha or EMA_ALPHA
+                    lx, ly = self.last_point
+                    sx = alpha * cx + (1 - alpha) * lx
+                    sy = alpha * cy + (1 - alpha) * ly
+                self.last_point = (sx, sy)
+            point = (int(sx), int(sy))
 
         confidence = min(1.0, best_area / max(laser_cfg.min_area, 1))
 
         mask_preview = None
         frame_preview = None
-        try:
-            preview_small = cv2.resize(mask, (160, 120), interpolation=cv2.INTER_NEAREST)
-            mask_preview = cv2.cvtColor(preview_small, cv2.COLOR_GRAY2RGB)
-        except Exception:
-            LOGGER.debug("Konnte Masken-Vorschau nicht erzeugen", exc_info=True)
-        try:
-            frame_small = cv2.resize(frame, (400, 300), interpolation=cv2.INTER_AREA)
-            frame_preview = cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB)
-        except Exception:
-            LOGGER.debug("Konnte Kamera-Vorschau nicht erzeugen", exc_info=True)
+        if self.previews_enabled:
+            try:
+                preview_small = cv2.resize(mask, (160, 120), dst=self._mask_small, interpolation=cv2.INTER_NEAREST)
+                # Einkanalig lassen (die UI nutzt eine Graustufen-Palette); Kopie, da der Puffer wiederverwendet wird.
+                mask_preview = preview_small.copy()
+            except Exception:
+                LOGGER.debug("Konnte Masken-Vorschau nicht erzeugen", exc_info=True)
+            try:
+                frame_small = cv2.resize(frame, (400, 300), dst=self._frame_small, interpolation=cv2.INTER_AREA)
+                # Bleibt BGR (die UI liest es per frombuffer "BGR"); Kopie, da der Puffer wiederverwendet wird.
+                frame_preview = frame_small.copy()
+            except Exception:
+                LOGGER.debug("Konnte Kamera-Vorschau nicht erzeugen", exc_info=True)
         return LaserDetection(
-            point=tuple(int(x) for x in smoothed) if smoothed is not None else None,
+            point=point,
             area=best_area,
             confidence=confidence,
             frame_ts=time.time(),
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Dict, Tuple, Type
+from typing import Callable, Dict, List, Tuple, Type
 
 import pygame
 
@@ -12,7 +12,7 @@ from .apps.paint import PaintApp
 from .apps.reaction import ReactionApp
 from .apps.target import TargetApp
 from .constants import DEFAULT_FONT_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE_FONT_SIZE
-from .ui import Button, layout_grid, make_font, render_label
+from .ui import Button, layout_grid, make_font
 
 LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +39,14 @@ class Launcher:
         self.font = make_font(DEFAULT_FONT_SIZE)
         self.title_font = make_font(TITLE_FONT_SIZE)
         self.buttons = self._create_buttons()
+        self._button_rects = [btn.rect for btn in self.buttons]
+        # Titel und Untertitel sind fest; einmal rendern statt bei jedem Neuzeichnen.
+        self._title_surf = self.title_font.render("Laser Arcade", True, (255, 255, 255)).convert_alpha()
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        self._subtitle_surf = self.font.render(
+            "Zielen und klicken mit Laser oder Maus", True, (255, 255, 255)
+        ).convert_alpha()
+        self._subtitle_rect = self._subtitle_surf.get_rect(center=(self.screen.get_width() // 2, 160))
 
     def _create_buttons(self):
         labels = list(APP_CLASSES.keys()) + ["Kalibrierung", "Testmodus", "Beenden"]
@@ -67,15 +75,22 @@ class Launcher:
 
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
         if event_type == "click":
-            for btn in self.buttons:
-                if btn.contains(pos):
-                    btn.action()
+            # Ein C-Aufruf statt Python-Schleife über alle Buttons (Buttons überlappen nicht).
+            index = pygame.Rect(pos, (1, 1)).collidelist(self._button_rects)
+            if index >= 0:
+                self.buttons[index].action()
 
-    def draw(self) -> None:
+    def update(self, dt: float) -> None:
+        return
+
+    def needs_redraw(self) -> bool:
+        return False
+
+    def draw(self) -> List[pygame.Rect]:
         self.screen.fill((20, 20, 40))
-        title_surf = self.title_font.render("Laser Arcade", True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(title_surf, title_rect)
-        render_label(self.screen, "Zielen und klicken mit Laser oder Maus", 160, size=DEFAULT_FONT_SIZE)
+        self.screen.blit(self._title_surf, self._title_rect)
+        self.screen.blit(self._subtitle_surf, self._subtitle_rect)
         for btn in self.buttons:
             btn.draw(self.screen)
+        # Der Launcher ist statisch; der erste Frame wird vom Hauptloop komplett geflippt.
+        return []
@@ -13,20 +13,23 @@ class PointerEvent:
     type: str  # move, down, up, click
     position: Tuple[int, int]
     source: str  # laser | mouse
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() in ms
 
 
 class DwellClickDetector:
     def __init__(self, dwell_ms: int, radius_px: int, debounce_ms: int = 350):
         self.dwell_ms = dwell_ms
         self.radius_px = radius_px
+        self._r2 = radius_px * radius_px
         self.debounce_ms = debounce_ms
         self.anchor: Optional[Tuple[int, int]] = None
-        self.anchor_ts: Optional[float] = None
-        self.last_click_ts: float = 0
+        self.anchor_ts: Optional[int] = None
+        self.last_click_ts: int = 0
 
-    def update(self, point: Optional[Tuple[int, int]]) -> Optional[str]:
-        now = time.time() * 1000
+    def update(self, point: Optional[Tuple[int, int]], now: Optional[int] = None) -> Optional[str]:
+        # Ganze Millisekunden auf der monotonen Uhr: immun gegen Sprünge der Systemzeit.
+        if now is None:
+            now = time.monotonic_ns() // 1_000_000
         if point is None:
             self.anchor = None
             self.anchor_ts = None
@@ -39,7 +42,7 @@ class DwellClickDetector:
 
         dx = point[0] - self.anchor[0]
         dy = point[1] - self.anchor[1]
-        if (dx * dx + dy * dy) ** 0.5 > self.radius_px:
+        if dx * dx + dy * dy > self._r2:
             self.anchor = point
             self.anchor_ts = now
             return None
@@ -68,18 +71,18 @@ class PointerRouter:
         self.detector = DwellClickDetector(dwell_ms=dwell_ms, radius_px=dwell_radius)
 
     def feed_point(self, point: Optional[Tuple[int, int]], source: str = "laser") -> None:
-        now = time.time()
+        now = time.monotonic_ns() // 1_000_000
         self.source = source
         if point:
             self.last_pos = point
             self.on_event(PointerEvent("move", point, source, now))
-            click = self.detector.update(point)
+            click = self.detector.update(point, now)
             if click:
                 self.on_event(PointerEvent("click", point, source, now))
         else:
-            self.detector.update(None)
+            self.detector.update(None, now)
 
     def feed_mouse_event(self, event_type: str, pos: Tuple[int, int]) -> None:
-        now = time.time()
+        now = time.monotonic_ns() // 1_000_000
         self.last_pos = pos
         self.on_event(PointerEvent(event_type, pos, "mouse", now))
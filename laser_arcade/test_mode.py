@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+from bisect import bisect_right
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import cached_property, partial
 from math import gcd
-from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import cv2
 import pygame
 
-from .calibration import apply_homography
+from .calibration import make_homography_fn
 from .config import Settings, save_settings
-from .laser_tracker import LaserDetection
-from .ui import Button, make_font
+from .constants import CAMERA_PROBE_CACHE_FILE
+from .laser_tracker import LaserDetection, configure_low_latency
+from .ui import Button, gray_surface, make_font
+from .v4l2 import IOCTL_AVAILABLE, query_device
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,17 +37,68 @@ class CameraOption:
     height: int
     fps: int
 
+    @cached_property
     def label(self) -> str:
         if not self.available:
             return f"/dev/video{self.index} (nicht verfügbar)"
         return f"/dev/video{self.index} ({self.width}x{self.height} @ {self.fps}fps)"
 
 
+def _video_nodes() -> List[os.DirEntry]:
+    """/dev/videoN-Einträge numerisch sortiert; scandir + Namensprüfung statt Path.glob/fnmatch."""
+    try:
+        with os.scandir("/dev") as it:
+            entries = [e for e in it if e.name.startswith("video") and e.name[5:].isdigit()]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: int(e.name[5:]))
+    return entries
+
+
+def _devices_fingerprint(entries: List[os.DirEntry]) -> str:
+    """Kurzer Hash über Name, Gerätenummer und mtime der Videoknoten; ändert sich beim An-/Abstecken."""
+    digest = hashlib.blake2b(digest_size=8)
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        digest.update(f"{entry.name}:{st.st_rdev}:{st.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def _load_probe_cache(fingerprint: str) -> Optional[List[CameraOption]]:
+    try:
+        data = json.loads(CAMERA_PROBE_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    try:
+        return [CameraOption(**entry) for entry in data["cameras"]]
+    except (KeyError, TypeError):
+        return None
+
+
+def _store_probe_cache(fingerprint: str, options: List[CameraOption]) -> None:
+    payload = json.dumps({"fingerprint": fingerprint, "cameras": [asdict(opt) for opt in options]})
+    try:
+        CAMERA_PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Atomar ersetzen, damit ein Abbruch mitten im Schreiben keinen halben Cache hinterlässt.
+        fd, tmp_path = tempfile.mkstemp(dir=CAMERA_PROBE_CACHE_FILE.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, CAMERA_PROBE_CACHE_FILE)
+    except OSError:
+        LOGGER.debug("Kamera-Cache konnte nicht geschrieben werden", exc_info=True)
+
+
 @dataclass
 class ResolutionOption:
     width: int
     height: int
 
+    @cached_property
     def label(self) -> str:
         divisor = gcd(self.width, self.height)
         ratio = f"{self.width // divisor}:{self.height // divisor}" if divisor else "-"
@@ -50,6 +111,7 @@ class CameraFormatOption:
     height: int
     fps: int
 
+    @cached_property
     def label(self) -> str:
         divisor = gcd(self.width, self.height)
         ratio = f"{self.width // divisor}:{self.height // divisor}" if divisor else "-"
@@ -103,6 +165,9 @@ class SliderControl:
 
 class TestMode:
     name = "Testmodus"
+    TEXT_CACHE_LIMIT = 256
+    # Vorschauen reichen mit ~15 Hz; jede neue Vorschau kostet Surface-Aufbau und großen Blit.
+    PREVIEW_INTERVAL = 1 / 15
 
     def __init__(
         self,
@@ -115,13 +180,15 @@ class TestMode:
         on_laser_change: Optional[Callable[[], None]] = None,
     ):
         self.screen = screen
+        # Größe nur bei Init/Auflösungswechsel abfragen; Layout-Helfer lesen sie pro Frame.
+        self._screen_size: Tuple[int, int] = screen.get_size()
         self.font = make_font(22)
         self.info_font = make_font(17)
         self.button_font = make_font(16)
         self.settings = settings
         self.homography = homography
+        self._homography_fn = make_homography_fn(homography)
         self.last_point_provider = last_point_provider
-        self.last_mapped = None
         self.last_detection: Optional[LaserDetection] = None
         self.on_camera_change = on_camera_change
         self.on_resolution_change = on_resolution_change
@@ -129,9 +196,15 @@ class TestMode:
         self.camera_ok = True
         self.camera_error: Optional[str] = None
 
-        self.camera_options: List[CameraOption] = self._discover_cameras()
+        # Gerätesuche im Hintergrund, damit der erste Frame nicht auf V4L2 wartet; update() übernimmt das Ergebnis.
+        self.camera_options: List[CameraOption] = []
+        self._option_by_index: Dict[int, CameraOption] = {}
+        self._discovered: Optional[List[CameraOption]] = None
+        self._discovery_pending = False
+        self._start_discovery()
         self.selected_option = self._find_selected_option()
         self.format_options: List[CameraFormatOption] = self._build_format_options()
+        self._format_by_key = {(opt.width, opt.height, opt.fps): opt for opt in self.format_options}
         self.selected_format = self._find_selected_format()
         self.resolution_options: List[ResolutionOption] = [
             ResolutionOption(1024, 768),
@@ -147,71 +220,153 @@ class TestMode:
         self.reload_button: Optional[Button] = None
         self.status_message: Optional[str] = None
         self.laser_status_message: Optional[str] = None
-        self.last_frame_preview = None
-        self.last_mask_preview = None
+        self._frame_surf: Optional[pygame.Surface] = None
+        self._mask_surf: Optional[pygame.Surface] = None
+        self._last_preview_ts = 0.0
         self.laser_sliders: List[SliderControl] = []
         self.preset_buttons: List[Button] = []
+        self._preset_rects: List[pygame.Rect] = []
+        self._metrics_cache: Optional[Tuple[Tuple[int, int], dict]] = None
+        self._panel_targets: List[Button] = []
+        self._panel_tops: List[int] = []
+        self._panel_bounds: Optional[pygame.Rect] = None
+        self._info_lines_cache: Optional[List[str]] = None
+        self._info_block: Optional[pygame.Surface] = None
+        self._crosshair = self._build_crosshair()
+        # (Laserpunkt, gemappter Punkt, Koordinatenzeile) – solange der Punkt ruht, kein Mapping/Rendern
+        self._pointer_cache: Optional[
+            Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]], pygame.Surface]
+        ] = None
+        self._panel_backgrounds: Dict[str, Tuple[Tuple[int, int], pygame.Surface]] = {}
+        self._status_lines_cache: Optional[List[str]] = None
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
         self._build_buttons()
         self._build_laser_controls()
 
     def set_detection(self, detection: Optional[LaserDetection]) -> None:
         self.last_detection = detection
-        if detection:
-            if detection.frame_preview is not None:
-                self.last_frame_preview = detection.frame_preview
-            if detection.mask_preview is not None:
-                self.last_mask_preview = detection.mask_preview
+        if not detection:
+            return
+        now = time.monotonic()
+        if now - self._last_preview_ts < self.PREVIEW_INTERVAL:
+            return
+        # Surfaces einmal pro angenommener Vorschau bauen; draw() blittet nur noch.
+        if detection.frame_preview is not None:
+            try:
+                # Direkt aus dem Array-Puffer statt über eine tobytes()-Kopie; die Vorschau ist BGR.
+                # Einmal ins Bildschirmformat konvertieren: die ~4 Blits bis zur nächsten Vorschau
+                # laufen dann ohne Pixelkonvertierung.
+                self._frame_surf = pygame.image.frombuffer(
+                    detection.frame_preview, detection.frame_preview.shape[1::-1], "BGR"
+                ).convert()
+            except Exception:
+                LOGGER.debug("Konnte Kamera-Preview nicht aufbauen", exc_info=True)
+            self._last_preview_ts = now
+        if detection.mask_preview is not None:
+            try:
+                self._mask_surf = gray_surface(detection.mask_preview).convert()
+            except Exception:
+                LOGGER.debug("Konnte Masken-Preview nicht aufbauen", exc_info=True)
+            self._last_preview_ts = now
 
     def set_camera_status(self, ok: bool, message: Optional[str]) -> None:
         self.camera_ok = ok
         self.camera_error = message
 
     def handle_pointer(self, event_type: str, pos: Tuple[int, int]) -> None:
-        if event_type == "move":
-            self.last_mapped = pos
-            return
         if event_type == "click":
-            for btn in self.camera_buttons:
-                if btn.contains(pos):
-                    btn.action()
-                    return
-            if self.apply_button and self.apply_button.contains(pos):
-                self.apply_button.action()
+            if self._panel_bounds is not None and self._panel_bounds.collidepoint(pos):
+                idx = bisect_right(self._panel_tops, pos[1]) - 1
+                if idx >= 0 and self._panel_targets[idx].contains(pos):
+                    self._panel_targets[idx].action()
                 return
-            for btn in self.format_buttons:
-                if btn.contains(pos):
-                    btn.action()
-                    return
-            for btn in self.resolution_buttons:
-                if btn.contains(pos):
-                    btn.action()
-                    return
-            if self.reload_button and self.reload_button.contains(pos):
-                self.reload_button.action()
+            index = pygame.Rect(pos, (1, 1)).collidelist(self._preset_rects)
+            if index >= 0:
+                self.preset_buttons[index].action()
                 return
-            for btn in self.preset_buttons:
-                if btn.contains(pos):
-                    btn.action()
-                    return
             for slider in self.laser_sliders:
                 if slider.handle_click(pos):
                     return
 
     def update(self, dt: float) -> None:
-        return
+        discovered = self._discovered
+        if self._discovery_pending and discovered is not None:
+            self._discovery_pending = False
+            self.camera_options = discovered
+            self._option_by_index = {opt.index: opt for opt in discovered}
+            # Nach einer Neusuche die Auswahl des Nutzers behalten, nicht auf die konfigurierte Kamera zurückfallen.
+            previous = self.selected_option
+            selected = self._option_by_index.get(previous.index) if previous else None
+            self.selected_option = selected or self._find_selected_option()
+            self._invalidate_lines()
+            self._build_buttons()
+
+    def _start_discovery(self, force: bool = False) -> None:
+        if self._discovery_pending:
+            return
+        self._discovered = None
+        self._discovery_pending = True
+        threading.Thread(target=self._run_discovery, args=(force,), name="CameraDiscovery", daemon=True).start()
 
-    def _discover_cameras(self) -> List[CameraOption]:
-        options: List[CameraOption] = []
-        for path in sorted(Path("/dev").glob("video*")):
-            try:
-                index = int(path.name.replace("video", ""))
-            except ValueError:
-                continue
-            options.append(self._probe_camera(index, str(path)))
-        if not options:
+    def _run_discovery(self, force: bool = False) -> None:
+        try:
+            self._discovered = self._discover_cameras(force=force)
+        except Exception:
+            LOGGER.exception("Kamerasuche fehlgeschlagen")
+            self._discovered = []
+
+    def needs_redraw(self) -> bool:
+        return True
+
+    @staticmethod
+    def _build_crosshair() -> pygame.Surface:
+        """Ring + Kreuz einmal vorzeichnen; pro Frame genügt dann ein Blit statt drei Zeichenaufrufen."""
+        surf = pygame.Surface((41, 41), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (0, 255, 0), (20, 20), 12, 3)
+        pygame.draw.line(surf, (0, 255, 0), (0, 20), (40, 20), 2)
+        pygame.draw.line(surf, (0, 255, 0), (20, 0), (20, 40), 2)
+        return surf.convert_alpha() if pygame.display.get_surface() is not None else surf
+
+    def _text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Gerenderte Beschriftungen wiederverwenden; nur für (halb-)statische Texte, nicht für Messwerte."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= self.TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _discover_cameras(self, force: bool = False) -> List[CameraOption]:
+        """Kameras per ioctl proben; nur der langsame VideoCapture-Fallback nutzt den Datei-Cache.
+
+        force=True umgeht den Datei-Cache.
+        """
+        entries = _video_nodes()
+        candidates = [(int(entry.name[5:]), entry.path) for entry in entries]
+        if not candidates:
             # Fallback to a small default range if /dev/video* is empty
-            for index in range(3):
-                options.append(self._probe_camera(index, f"/dev/video{index}"))
+            candidates = [(index, f"/dev/video{index}") for index in range(3)]
+        if IOCTL_AVAILABLE:
+            # ioctl-Abfragen kosten Mikrosekunden: immer frisch, kein veraltetes "nicht verfügbar" aus dem Cache.
+            return [self._probe_camera(*candidate) for candidate in candidates]
+        fingerprint = _devices_fingerprint(entries)
+        if not force:
+            cached = _load_probe_cache(fingerprint)
+            if cached is not None:
+                return cached
+        # Ein V4L2-Open kann pro Gerät Sekunden blockieren (GIL ist dabei frei): parallel proben,
+        # sodass die Suche so lange dauert wie das langsamste Gerät statt wie alle zusammen.
+        # Der Log-Level ist global in OpenCV, daher einmal um den ganzen Block statt pro Probe.
+        with self._silence_opencv_logs():
+            with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as pool:
+                options = list(pool.map(lambda c: self._probe_camera(*c), candidates))
+        # Die konfigurierte Kamera ist meist vom Tracker belegt; wirkt sie "nicht verfügbar",
+        # nicht cachen, sonst bliebe sie es bis zum nächsten Umstecken.
+        busy = any(not opt.available and opt.index == self.settings.camera.device_index for opt in options)
+        if not busy:
+            _store_probe_cache(fingerprint, options)
         return options
 
     @contextmanager
@@ -231,14 +386,12 @@ class TestMode:
             yield
 
     def _probe_camera(self, index: int, path: str) -> CameraOption:
-        with self._silence_opencv_logs():
-            cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
-            available = cap.isOpened()
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) if available else 0
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) if available else 0
-            fps = int(cap.get(cv2.CAP_PROP_FPS)) if available else 0
-            if cap is not None:
-                cap.release()
+        # Nur Metadaten nötig: per ioctl statt Stream-Open; blockiert nicht und belegt das Gerät nicht.
+        info = query_device(path)
+        if info is not None:
+            available, width, height, fps = info.capture, info.width, info.height, info.fps
+        else:
+            available, width, height, fps = self._probe_camera_capture(index)
         width = width if width > 0 else self.settings.camera.width
         height = height if height > 0 else self.settings.camera.height
         fps = fps if fps > 0 else self.settings.camera.fps
@@ -251,11 +404,23 @@ class TestMode:
             fps=fps or self.settings.camera.fps,
         )
 
+    def _probe_camera_capture(self, index: int) -> Tuple[bool, int, int, int]:
+        cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        available = cap.isOpened()
+        if available:
+            # Manche Treiber füllen sonst erst den 4-Frame-Puffer, bevor Abfragen zurückkehren.
+            configure_low_latency(cap)
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = int(cap.get(cv2.CAP_PROP_FPS))
+        else:
+            width = height = fps = 0
+        cap.release()
+        return available, width, height, fps
+
     def _find_selected_option(self) -> Optional[CameraOption]:
-        for opt in self.camera_options:
-            if opt.index == self.settings.camera.device_index:
-                return opt
-        return self.camera_options[0] if self.camera_options else None
+        selected = self._option_by_index.get(self.settings.camera.device_index)
+        return selected or (self.camera_options[0] if self.camera_options else None)
 
     def _build_format_options(self) -> List[CameraFormatOption]:
         defaults = [
@@ -270,19 +435,14 @@ class TestMode:
             self.settings.camera.height,
             self.settings.camera.fps,
         )
-        options = { (opt.width, opt.height, opt.fps): opt for opt in defaults }
-        options[(current.width, current.height, current.fps)] = current
-        return list(options.values())
+        if current not in defaults:
+            defaults.append(current)
+        return defaults
 
     def _find_selected_format(self) -> Optional[CameraFormatOption]:
-        for opt in self.format_options:
-            if (
-                opt.width == self.settings.camera.width
-                and opt.height == self.settings.camera.height
-                and opt.fps == self.settings.camera.fps
-            ):
-                return opt
-        return self.format_options[0] if self.format_options else None
+        camera = self.settings.camera
+        selected = self._format_by_key.get((camera.width, camera.height, camera.fps))
+        return selected or (self.format_options[0] if self.format_options else None)
 
     def _find_selected_resolution(self) -> Optional[ResolutionOption]:
         for opt in self.resolution_options:
@@ -291,11 +451,16 @@ class TestMode:
         return self.resolution_options[0] if self.resolution_options else None
 
     def _panel_metrics(self) -> dict:
+        # Hängt nur von Bildschirmgröße und (festen) Font-Metriken ab: einmal pro Größe rechnen.
+        size = self._screen_size
+        if self._metrics_cache is not None and self._metrics_cache[0] == size:
+            return self._metrics_cache[1]
         panel_width = 260
         panel_margin = 14
         panel_top = 32
-        panel_height = self.screen.get_height() - 64
-        panel_x = self.screen.get_width() - panel_width - panel_margin
+        screen_width, screen_height = size
+        panel_height = screen_height - 64
+        panel_x = screen_width - panel_width - panel_margin
         panel_rect = pygame.Rect(panel_x, panel_top, panel_width, panel_height)
         title_y = panel_rect.y + 10
         hint_y = title_y + self.font.get_linesize() + 4
@@ -306,7 +471,7 @@ class TestMode:
         inner_padding = 10
         button_width = panel_width - inner_padding * 2
 
-        return {
+        metrics = {
             "panel_rect": panel_rect,
             "panel_width": panel_width,
             "status_y": status_y,
@@ -315,13 +480,16 @@ class TestMode:
             "button_x": panel_rect.x + inner_padding,
             "button_width": button_width,
         }
+        self._metrics_cache = (size, metrics)
+        return metrics
 
     def _laser_panel_rect(self) -> pygame.Rect:
-        panel_width = self.screen.get_width() - self._panel_metrics()["panel_width"] - 50
+        screen_width, screen_height = self._screen_size
+        panel_width = screen_width - self._panel_metrics()["panel_width"] - 50
         panel_width = max(400, panel_width)
         panel_height = 360
         x = 20
-        y = self.screen.get_height() - panel_height - 18
+        y = screen_height - panel_height - 18
         return pygame.Rect(x, y, panel_width, panel_height)
 
     def _laser_presets(self) -> dict:
@@ -380,11 +548,12 @@ class TestMode:
                 Button(
                     rect=rect,
                     label=label,
-                    action=lambda p=preset, name=label: self._apply_preset(p, name),
+                    action=partial(self._apply_preset, preset, label),
                     font=self.button_font,
                     bg_color=(90, 120, 180),
                 )
             )
+        self._preset_rects = [btn.rect for btn in self.preset_buttons]
 
         slider_cols = 3
         col_padding = 12
@@ -508,16 +677,13 @@ class TestMode:
         button_height = 38
         for idx, opt in enumerate(self.camera_options):
             rect = pygame.Rect(x, y + idx * (button_height + spacing), panel_width, button_height)
-            bg_color = (60, 120, 200) if opt.available else (90, 90, 90)
-            if self.selected_option and opt.index == self.selected_option.index:
-                bg_color = (50, 150, 90)
             self.camera_buttons.append(
                 Button(
                     rect=rect,
-                    label=opt.label(),
-                    action=lambda o=opt: self._select_camera(o),
+                    label=opt.label,
+                    action=partial(self._select_camera, opt),
                     font=self.button_font,
-                    bg_color=bg_color,
+                    bg_color=self._camera_color(opt),
                 )
             )
         apply_y = y + max(len(self.camera_options), 1) * (button_height + spacing) + 4
@@ -538,20 +704,13 @@ class TestMode:
                 panel_width,
                 format_button_height,
             )
-            bg_color = (100, 100, 150)
-            if self.selected_format and (opt.width, opt.height, opt.fps) == (
-                self.selected_format.width,
-                self.selected_format.height,
-                self.selected_format.fps,
-            ):
-                bg_color = (80, 140, 200)
             self.format_buttons.append(
                 Button(
                     rect=rect,
-                    label=opt.label(),
-                    action=lambda o=opt: self._select_format(o),
+                    label=opt.label,
+                    action=partial(self._select_format, opt),
                     font=self.button_font,
-                    bg_color=bg_color,
+                    bg_color=self._format_color(opt),
                 )
             )
 
@@ -559,19 +718,13 @@ class TestMode:
         res_button_height = 36
         for idx, opt in enumerate(self.resolution_options):
             rect = pygame.Rect(x, res_section_y + idx * (res_button_height + spacing), panel_width, res_button_height)
-            bg_color = (90, 110, 160)
-            if self.selected_resolution and (opt.width, opt.height) == (
-                self.selected_resolution.width,
-                self.selected_resolution.height,
-            ):
-                bg_color = (110, 150, 210)
             self.resolution_buttons.append(
                 Button(
                     rect=rect,
-                    label=opt.label(),
-                    action=lambda o=opt: self._select_resolution(o),
+                    label=opt.label,
+                    action=partial(self._select_resolution, opt),
                     font=self.button_font,
-                    bg_color=bg_color,
+                    bg_color=self._resolution_color(opt),
                 )
             )
 
@@ -583,21 +736,63 @@ class TestMode:
             font=self.button_font,
             bg_color=(70, 170, 110),
         )
+        # Alle Buttons des Kamera-Panels liegen untereinander in einer Spalte: nach Oberkante sortiert
+        # genügt bisect statt Schleifen über alle Listen.
+        targets = self.camera_buttons + [self.apply_button] + self.format_buttons + self.resolution_buttons
+        targets.append(self.reload_button)
+        targets.sort(key=lambda b: b.rect.top)
+        self._panel_targets = targets
+        self._panel_tops = [b.rect.top for b in targets]
+        self._panel_bounds = targets[0].rect.unionall([b.rect for b in targets[1:]])
+
+    def _camera_color(self, opt: CameraOption) -> Tuple[int, int, int]:
+        if self.selected_option and opt.index == self.selected_option.index:
+            return (50, 150, 90)
+        return (60, 120, 200) if opt.available else (90, 90, 90)
+
+    def _format_color(self, opt: CameraFormatOption) -> Tuple[int, int, int]:
+        if self.selected_format and (opt.width, opt.height, opt.fps) == (
+            self.selected_format.width,
+            self.selected_format.height,
+            self.selected_format.fps,
+        ):
+            return (80, 140, 200)
+        return (100, 100, 150)
+
+    def _resolution_color(self, opt: ResolutionOption) -> Tuple[int, int, int]:
+        if self.selected_resolution and (opt.width, opt.height) == (
+            self.selected_resolution.width,
+            self.selected_resolution.height,
+        ):
+            return (110, 150, 210)
+        return (90, 110, 160)
+
+    def _refresh_button_colors(self) -> None:
+        """Auswahl ändert nur Farben; Geometrie und Beschriftungen der Buttons bleiben bestehen."""
+        for btn, opt in zip(self.camera_buttons, self.camera_options):
+            btn.bg_color = self._camera_color(opt)
+        for btn, opt in zip(self.format_buttons, self.format_options):
+            btn.bg_color = self._format_color(opt)
+        for btn, opt in zip(self.resolution_buttons, self.resolution_options):
+            btn.bg_color = self._resolution_color(opt)
 
     def _select_camera(self, option: CameraOption) -> None:
         self.selected_option = option
         self.status_message = None
-        self._build_buttons()
+        self._invalidate_lines()
+        self._refresh_button_colors()
 
     def _select_format(self, option: CameraFormatOption) -> None:
         self.selected_format = option
         self.status_message = None
-        self._build_buttons()
+        self._invalidate_lines()
+        self._refresh_button_colors()
 
     def _select_resolution(self, option: ResolutionOption) -> None:
         self.selected_resolution = option
         self.status_message = None
-        self._build_buttons()
+        self._invalidate_lines()
+        self._refresh_button_colors()
 
     def _apply_selection(self) -> None:
         if not self.selected_option:
@@ -607,6 +802,8 @@ class TestMode:
             self.status_message = "Gerät nicht verfügbar."
             self.camera_ok = False
             self.camera_error = "Gerät nicht verfügbar."
+            # Evtl. veralteter Cache-Eintrag (Gerät war beim Proben belegt): im Hintergrund neu suchen.
+            self._start_discovery(force=True)
             return
         cam_cfg = self.settings.camera
         cam_cfg.device_index = self.selected_option.index
@@ -619,6 +816,7 @@ class TestMode:
             cam_cfg.height = max(1, self.selected_option.height)
             cam_cfg.fps = max(1, self.selected_option.fps)
         save_settings(self.settings)
+        self._invalidate_lines()
         if self.on_camera_change:
             ok, message = self.on_camera_change()
             self.camera_ok = ok
@@ -632,6 +830,7 @@ class TestMode:
         self.settings.screen_width = self.selected_resolution.width
         self.settings.screen_height = self.selected_resolution.height
         save_settings(self.settings)
+        self._invalidate_lines()
         try:
             reload_message = self.on_resolution_change() if self.on_resolution_change else None
             self.status_message = reload_message or "Auflösung übernommen."
@@ -643,126 +842,153 @@ class TestMode:
         self.screen.fill((15, 10, 15))
         detection = self.last_detection
         laser_pos = detection.point if detection and detection.point else self.last_point_provider()
-        mapped = apply_homography(self.homography, laser_pos) if (self.homography is not None and laser_pos) else None
+        mapped, pointer_text = self._pointer_state(laser_pos)
 
         preview_rect = None
-        frame_preview = None
-        if detection and detection.frame_preview is not None:
-            frame_preview = detection.frame_preview
-        elif self.last_frame_preview is not None:
-            frame_preview = self.last_frame_preview
-
-        if frame_preview is not None:
-            try:
-                surf = pygame.image.frombuffer(
-                    frame_preview.tobytes(),
-                    frame_preview.shape[1::-1],
-                    "RGB",
-                )
-                preview_rect = surf.get_rect(topleft=(20, 80))
-                pygame.draw.rect(self.screen, (220, 220, 220), preview_rect.inflate(6, 6), 1)
-                self.screen.blit(surf, preview_rect)
-            except Exception:
-                LOGGER.debug("Konnte Kamera-Preview nicht anzeigen", exc_info=True)
+        if self._frame_surf is not None:
+            preview_rect = self._frame_surf.get_rect(topleft=(20, 80))
+            pygame.draw.rect(self.screen, (220, 220, 220), preview_rect.inflate(6, 6), 1)
+            self.screen.blit(self._frame_surf, preview_rect)
 
-        mask_preview = None
-        if detection and detection.mask_preview is not None:
-            mask_preview = detection.mask_preview
-        elif self.last_mask_preview is not None:
-            mask_preview = self.last_mask_preview
-
-        if mask_preview is not None:
-            try:
-                surf = pygame.image.frombuffer(
-                    mask_preview.tobytes(),
-                    mask_preview.shape[1::-1],
-                    "RGB",
-                )
-                offset_x = preview_rect.right + 20 if preview_rect else 20
-                mask_rect = surf.get_rect(topleft=(offset_x, 80))
-                pygame.draw.rect(self.screen, (120, 180, 120), mask_rect.inflate(6, 6), 1)
-                self.screen.blit(surf, mask_rect)
-            except Exception:
-                LOGGER.debug("Konnte Masken-Preview nicht anzeigen", exc_info=True)
+        if self._mask_surf is not None:
+            offset_x = preview_rect.right + 20 if preview_rect else 20
+            mask_rect = self._mask_surf.get_rect(topleft=(offset_x, 80))
+            pygame.draw.rect(self.screen, (120, 180, 120), mask_rect.inflate(6, 6), 1)
+            self.screen.blit(self._mask_surf, mask_rect)
 
         if laser_pos:
             pygame.draw.circle(self.screen, (255, 0, 0), laser_pos, 10)
         if mapped:
-            pygame.draw.circle(self.screen, (0, 255, 0), mapped, 12, 3)
-            cross = [
-                (mapped[0] - 20, mapped[1]),
-                (mapped[0] + 20, mapped[1]),
-                (mapped[0], mapped[1] - 20),
-                (mapped[0], mapped[1] + 20),
-            ]
-            pygame.draw.line(self.screen, (0, 255, 0), cross[0], cross[1], 2)
-            pygame.draw.line(self.screen, (0, 255, 0), cross[2], cross[3], 2)
+            self.screen.blit(self._crosshair, (mapped[0] - 20, mapped[1] - 20))
 
-        mode_text = self.info_font.render(f"Aktiver Modus: {self.name}", True, (210, 210, 230))
+        mode_text = self._text(self.info_font, f"Aktiver Modus: {self.name}", (210, 210, 230))
         self.screen.blit(mode_text, (20, 52))
 
-        txt = f"Laser: {laser_pos} | Mapped: {mapped}"
-        text = self.font.render(txt, True, (255, 255, 255))
-        self.screen.blit(text, (20, 20))
+        self.screen.blit(pointer_text, (20, 20))
 
-        camera = self.settings.camera
-        info_lines = [
-            "Kamera-Preview (USB Logitech C922 PRO empfohlen)",
-            f"Aktiv: /dev/video{camera.device_index} @ {camera.width}x{camera.height} {camera.fps}fps",
-            f"Auflösung: {self.settings.screen_width}x{self.settings.screen_height}",
-            "Einstellungen werden nach Auswahl gespeichert und Kamera neu gestartet.",
-            "Nutze das Bild zum Ausrichten und zur Belichtung (z.B. v4l2-ctl).",
-        ]
-        info_base_y = min(420, self._laser_panel_rect().y - len(info_lines) * 24 - 8)
-        for idx, line in enumerate(info_lines):
-            info = self.info_font.render(line, True, (230, 230, 230))
-            self.screen.blit(info, (20, info_base_y + idx * 24))
+        info_block = self._info_block_surface()
+        info_base_y = min(420, self._laser_panel_rect().y - info_block.get_height() - 8)
+        self.screen.blit(info_block, (20, info_base_y))
 
         self._draw_laser_panel(detection)
         self._draw_camera_panel()
 
+    def _pointer_state(
+        self, laser_pos: Optional[Tuple[int, int]]
+    ) -> Tuple[Optional[Tuple[int, int]], pygame.Surface]:
+        cached = self._pointer_cache
+        if cached is not None and cached[0] == laser_pos:
+            return cached[1], cached[2]
+        mapped = self._homography_fn(*laser_pos) if (self._homography_fn is not None and laser_pos) else None
+        text = self.font.render(f"Laser: {laser_pos} | Mapped: {mapped}", True, (255, 255, 255))
+        self._pointer_cache = (laser_pos, mapped, text)
+        return mapped, text
+
+    def _info_lines(self) -> List[str]:
+        if self._info_lines_cache is None:
+            camera = self.settings.camera
+            self._info_lines_cache = [
+                "Kamera-Preview (USB Logitech C922 PRO empfohlen)",
+                f"Aktiv: /dev/video{camera.device_index} @ {camera.width}x{camera.height} {camera.fps}fps",
+                f"Auflösung: {self.settings.screen_width}x{self.settings.screen_height}",
+                "Einstellungen werden nach Auswahl gespeichert und Kamera neu gestartet.",
+                "Nutze das Bild zum Ausrichten und zur Belichtung (z.B. v4l2-ctl).",
+            ]
+        return self._info_lines_cache
+
+    def _info_block_surface(self) -> pygame.Surface:
+        """Alle Infozeilen in einer Fläche, damit pro Frame ein Blit statt einem pro Zeile anfällt."""
+        if self._info_block is None:
+            lines = [self._text(self.info_font, line, (230, 230, 230)) for line in self._info_lines()]
+            width = max((line.get_width() for line in lines), default=0)
+            block = pygame.Surface((width, len(lines) * 24), pygame.SRCALPHA).convert_alpha()
+            for idx, line in enumerate(lines):
+                block.blit(line, (0, idx * 24))
+            self._info_block = block
+        return self._info_block
+
+    def _status_lines(self) -> List[str]:
+        if self._status_lines_cache is None:
+            self._status_lines_cache = [
+                f"Kamera: {self.selected_option.label if self.selected_option else '—'}",
+                f"Format: {self.selected_format.label if self.selected_format else '—'}",
+                f"Anzeige: {self.selected_resolution.label if self.selected_resolution else '—'}",
+            ]
+        return self._status_lines_cache
+
+    def _invalidate_lines(self) -> None:
+        """Info-/Statuszeilen nach Auswahl- oder Einstellungsänderung neu formatieren lassen."""
+        self._info_lines_cache = None
+        self._info_block = None
+        self._status_lines_cache = None
+
+    def _panel_background(
+        self,
+        key: str,
+        size: Tuple[int, int],
+        fill: Tuple[int, int, int],
+        border: Tuple[int, int, int],
+        texts: List[Tuple[pygame.Surface, Tuple[int, int]]],
+    ) -> pygame.Surface:
+        """Panelfläche, Rahmen und feste Überschriften einmal pro Größe vorzeichnen.
+
+        Opak auf Hintergrundfarbe: ein Blit ohne Alpha ist schneller als die zwei abgerundeten Rechtecke;
+        unter den Panel-Ecken liegt sonst nur der Bildschirmhintergrund.
+        """
+        cached = self._panel_backgrounds.get(key)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        surf = pygame.Surface(size).convert()
+        surf.fill((15, 10, 15))
+        rect = surf.get_rect()
+        pygame.draw.rect(surf, fill, rect, border_radius=10)
+        pygame.draw.rect(surf, border, rect, 2, border_radius=10)
+        for text, pos in texts:
+            surf.blit(text, pos)
+        self._panel_backgrounds[key] = (size, surf)
+        return surf
+
     def _draw_camera_panel(self) -> None:
         metrics = self._panel_metrics()
         panel_rect = metrics["panel_rect"]
-        pygame.draw.rect(self.screen, (28, 28, 40), panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (80, 80, 120), panel_rect, 2, border_radius=10)
-
-        title = self.font.render("Kamera- & Anzeige", True, (255, 255, 255))
-        self.screen.blit(title, (panel_rect.x + 12, panel_rect.y + 10))
-
-        hint = self.info_font.render("Standard: Logitech C922 PRO", True, (210, 210, 210))
-        self.screen.blit(hint, (panel_rect.x + 12, panel_rect.y + 32))
+        background = self._panel_background(
+            "camera",
+            panel_rect.size,
+            (28, 28, 40),
+            (80, 80, 120),
+            [
+                (self._text(self.font, "Kamera- & Anzeige", (255, 255, 255)), (12, 10)),
+                (self._text(self.info_font, "Standard: Logitech C922 PRO", (210, 210, 210)), (12, 32)),
+            ],
+        )
+        self.screen.blit(background, panel_rect)
 
         status_y = metrics["status_y"]
-        status_lines = [
-            f"Kamera: {self.selected_option.label() if self.selected_option else '—'}",
-            f"Format: {self.selected_format.label() if self.selected_format else '—'}",
-            f"Anzeige: {self.selected_resolution.label() if self.selected_resolution else '—'}",
-        ]
-        for idx, line in enumerate(status_lines):
-            surf = self.info_font.render(line, True, (220, 220, 220))
+        for idx, line in enumerate(self._status_lines()):
+            surf = self._text(self.info_font, line, (220, 220, 220))
             self.screen.blit(surf, (panel_rect.x + 12, status_y + idx * 20))
 
         if not self.camera_ok:
-            error_txt = self.info_font.render(
-                self.camera_error or "Gerät nicht verfügbar.", True, (240, 120, 120)
-            )
+            error_txt = self._text(self.info_font, self.camera_error or "Gerät nicht verfügbar.", (240, 120, 120))
             self.screen.blit(error_txt, (panel_rect.x + 12, status_y + 44))
         elif self.status_message:
-            status_txt = self.info_font.render(self.status_message, True, (140, 220, 140))
+            status_txt = self._text(self.info_font, self.status_message, (140, 220, 140))
             self.screen.blit(status_txt, (panel_rect.x + 12, status_y + 44))
 
         camera_section_y = metrics["camera_section_y"]
-        cam_title = self.info_font.render("Kamera-Geräte", True, (230, 230, 250))
+        cam_title = self._text(self.info_font, "Kamera-Geräte", (230, 230, 250))
         self.screen.blit(cam_title, (panel_rect.x + 12, camera_section_y))
 
+        if self._discovery_pending:
+            pending = self._text(self.info_font, "Geräte werden gesucht…", (200, 200, 220))
+            self.screen.blit(pending, (panel_rect.x + 12, metrics["camera_buttons_top"] + 10))
         for btn in self.camera_buttons:
             btn.draw(self.screen)
         if self.apply_button:
             self.apply_button.draw(self.screen)
 
         format_section_y = self.apply_button.rect.bottom + 12 if self.apply_button else camera_section_y + 80
-        format_title = self.info_font.render("Kamera-Format", True, (230, 230, 250))
+        format_title = self._text(self.info_font, "Kamera-Format", (230, 230, 250))
         self.screen.blit(format_title, (panel_rect.x + 12, format_section_y))
 
         for btn in self.format_buttons:
@@ -773,7 +999,7 @@ class TestMode:
             if self.format_buttons
             else format_section_y + 80
         )
-        res_title = self.info_font.render("Anzeige-Auflösung", True, (230, 230, 250))
+        res_title = self._text(self.info_font, "Anzeige-Auflösung", (230, 230, 250))
         self.screen.blit(res_title, (panel_rect.x + 12, res_section_y))
 
         for btn in self.resolution_buttons:
@@ -783,16 +1009,20 @@ class TestMode:
 
     def _draw_laser_panel(self, detection: Optional[LaserDetection]) -> None:
         panel_rect = self._laser_panel_rect()
-        pygame.draw.rect(self.screen, (24, 30, 36), panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (70, 90, 110), panel_rect, 2, border_radius=10)
-
-        title = self.font.render("Laser-Erkennung", True, (240, 240, 255))
-        self.screen.blit(title, (panel_rect.x + 12, panel_rect.y + 8))
-        subtitle = self.info_font.render("HSV + Bereich + Kernel", True, (200, 200, 210))
-        self.screen.blit(subtitle, (panel_rect.x + 14, panel_rect.y + 28))
+        background = self._panel_background(
+            "laser",
+            panel_rect.size,
+            (24, 30, 36),
+            (70, 90, 110),
+            [
+                (self._text(self.font, "Laser-Erkennung", (240, 240, 255)), (12, 8)),
+                (self._text(self.info_font, "HSV + Bereich + Kernel", (200, 200, 210)), (14, 28)),
+            ],
+        )
+        self.screen.blit(background, panel_rect)
 
         if self.laser_status_message:
-            status = self.info_font.render(self.laser_status_message, True, (140, 220, 160))
+            status = self._text(self.info_font, self.laser_status_message, (140, 220, 160))
             self.screen.blit(status, (panel_rect.x + 12, panel_rect.y + 52))
 
         for btn in self.preset_buttons:
@@ -809,22 +1039,18 @@ class TestMode:
             txt = self.info_font.render(f"Area {detection.area:.0f} | Conf {detection.confidence:.2f}", True, (220, 220, 220))
             self.screen.blit(txt, (indicator_x + 14, indicator_y - 8))
 
-        mask_preview = detection.mask_preview if detection and detection.mask_preview is not None else self.last_mask_preview
-        if mask_preview is not None:
-            try:
-                surf = pygame.image.frombuffer(
-                    mask_preview.tobytes(),
-                    mask_preview.shape[1::-1],
-                    "RGB",
-                )
-                preview_rect = surf.get_rect(bottomright=(panel_rect.right - 10, panel_rect.bottom - 10))
-                pygame.draw.rect(self.screen, (120, 180, 120), preview_rect.inflate(6, 6), 1)
-                self.screen.blit(surf, preview_rect)
-            except Exception:
-                LOGGER.debug("Konnte Masken-Indikator nicht anzeigen", exc_info=True)
+        if self._mask_surf is not None:
+            preview_rect = self._mask_surf.get_rect(bottomright=(panel_rect.right - 10, panel_rect.bottom - 10))
+            pygame.draw.rect(self.screen, (120, 180, 120), preview_rect.inflate(6, 6), 1)
+            self.screen.blit(self._mask_surf, preview_rect)
 
     def update_context(self, screen: pygame.Surface, homography) -> None:
         self.screen = screen
+        self._screen_size = screen.get_size()
         self.homography = homography
+        self._homography_fn = make_homography_fn(homography)
+        self._text_cache.clear()
+        self._pointer_cache = None
+        self._invalidate_lines()
         self._build_buttons()
         self._build_laser_controls()
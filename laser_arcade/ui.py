@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Callable, List, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 
 import pygame
 
-from .constants import DEFAULT_FONT_SIZE, LARGE_FONT_SIZE
+from .constants import LARGE_FONT_SIZE
 
 LOGGER = logging.getLogger(__name__)
 
 
+GRAY_PALETTE = [(i, i, i) for i in range(256)]
+
+
+def gray_surface(pixels) -> pygame.Surface:
+    """8-Bit-Graustufenbild (H x W, zusammenhängend) ohne RGB-Konvertierung als Surface."""
+    surf = pygame.image.frombuffer(pixels, pixels.shape[1::-1], "P")
+    surf.set_palette(GRAY_PALETTE)
+    return surf
+
+
+@lru_cache(maxsize=32)
 def make_font(size: int) -> pygame.font.Font:
+    """Eine Font-Instanz pro Größe; SysFont sucht sonst bei jedem Aufruf erneut und lädt von Platte."""
     return pygame.font.SysFont("Arial", size)
 
 
@@ -23,10 +36,22 @@ class Button:
     font: pygame.font.Font
     bg_color: Tuple[int, int, int] = (30, 144, 255)
     text_color: Tuple[int, int, int] = (255, 255, 255)
+    _text_cache: Optional[Tuple[tuple, pygame.Surface]] = field(default=None, init=False, repr=False, compare=False)
+
+    def text_surface(self) -> pygame.Surface:
+        """Beschriftung nur neu rendern, wenn sich Text, Farbe oder Schrift geändert haben."""
+        key = (self.label, self.text_color, self.font)
+        cached = self._text_cache
+        if cached is None or cached[0] != key:
+            text_surf = self.font.render(self.label, True, self.text_color)
+            if pygame.display.get_surface() is not None:
+                text_surf = text_surf.convert_alpha()
+            cached = self._text_cache = (key, text_surf)
+        return cached[1]
 
     def draw(self, surface: pygame.Surface) -> None:
         pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=8)
-        text_surf = self.font.render(self.label, True, self.text_color)
+        text_surf = self.text_surface()
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -55,10 +80,3 @@ def layout_grid(
         y = top + row * (button_height + padding)
         rects.append((label, pygame.Rect(x, y, button_width, button_height)))
     return rects
-
-
-def render_label(surface: pygame.Surface, text: str, y: int, size: int = DEFAULT_FONT_SIZE) -> None:
-    font = make_font(size)
-    text_surf = font.render(text, True, (255, 255, 255))
-    text_rect = text_surf.get_rect(center=(surface.get_width() // 2, y))
-    surface.blit(text_surf, text_rect)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import ctypes
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Nicht-Linux: Aufrufer fällt auf cv2.VideoCapture zurück
+    fcntl = None
+
+# Ohne ioctl bleibt nur das (langsame) Proben per cv2.VideoCapture.
+IOCTL_AVAILABLE = fcntl is not None
+
+LOGGER = logging.getLogger(__name__)
+
+_V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+# struct v4l2_capability: driver[16], card[32], bus_info[32], version, capabilities, device_caps, reserved[3]
+_CAPABILITY_SIZE = 104
+# struct v4l2_format: u32 type + Union (200 Bytes), die wegen v4l2_window-Zeigern auf Zeigergröße ausgerichtet ist
+_FMT_UNION_OFFSET = max(4, ctypes.alignment(ctypes.c_void_p))
+_FORMAT_SIZE = _FMT_UNION_OFFSET + 200
+# struct v4l2_streamparm: u32 type + Union (200 Bytes) ohne Zeiger
+_STREAMPARM_SIZE = 4 + 200
+
+
+def _iowr(nr: int, size: int, read: bool = True, write: bool = True) -> int:
+    direction = (2 if read else 0) | (1 if write else 0)
+    return (direction << 30) | (size << 16) | (ord("V") << 8) | nr
+
+
+VIDIOC_QUERYCAP = _iowr(0, _CAPABILITY_SIZE, write=False)
+VIDIOC_G_FMT = _iowr(4, _FORMAT_SIZE)
+VIDIOC_G_PARM = _iowr(21, _STREAMPARM_SIZE)
+
+
+@dataclass
+class DeviceInfo:
+    capture: bool
+    width: int
+    height: int
+    fps: int
+
+
+def query_device(path: str) -> Optional[DeviceInfo]:
+    """Format eines Videoknotens per ioctl lesen, ohne Stream zu öffnen oder Puffer anzulegen.
+
+    Liefert None, wenn ioctl hier nicht verfügbar ist; dann muss der Aufrufer selbst proben.
+    Nicht öffnbare Knoten und Knoten ohne Capture-Fähigkeit (z.B. Metadaten) gelten als capture=False.
+    """
+    if not IOCTL_AVAILABLE:
+        return None
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+    except OSError:
+        return DeviceInfo(capture=False, width=0, height=0, fps=0)
+    try:
+        try:
+            cap = bytearray(_CAPABILITY_SIZE)
+            fcntl.ioctl(fd, VIDIOC_QUERYCAP, cap)
+        except OSError:
+            return DeviceInfo(capture=False, width=0, height=0, fps=0)
+        capabilities, device_caps = struct.unpack_from("=II", cap, 84)
+        if capabilities & _V4L2_CAP_DEVICE_CAPS:
+            capabilities = device_caps
+        if not capabilities & _V4L2_CAP_VIDEO_CAPTURE:
+            return DeviceInfo(capture=False, width=0, height=0, fps=0)
+
+        width = height = fps = 0
+        try:
+            fmt = bytearray(_FORMAT_SIZE)
+            struct.pack_into("=I", fmt, 0, _V4L2_BUF_TYPE_VIDEO_CAPTURE)
+            fcntl.ioctl(fd, VIDIOC_G_FMT, fmt)
+            width, height = struct.unpack_from("=II", fmt, _FMT_UNION_OFFSET)
+        except OSError:
+            LOGGER.debug("VIDIOC_G_FMT fehlgeschlagen für %s", path, exc_info=True)
+        try:
+            parm = bytearray(_STREAMPARM_SIZE)
+            struct.pack_into("=I", parm, 0, _V4L2_BUF_TYPE_VIDEO_CAPTURE)
+            fcntl.ioctl(fd, VIDIOC_G_PARM, parm)
+            # v4l2_captureparm: capability, capturemode, timeperframe{numerator, denominator}
+            numerator, denominator = struct.unpack_from("=II", parm, 12)
+            if numerator:
+                fps = round(denominator / numerator)
+        except OSError:
+            LOGGER.debug("VIDIOC_G_PARM fehlgeschlagen für %s", path, exc_info=True)
+        return DeviceInfo(capture=True, width=width, height=height, fps=fps)
+    finally:
+        os.close(fd)